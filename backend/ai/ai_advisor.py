@@ -480,7 +480,7 @@ Reponds UNIQUEMENT avec ce JSON:
                 rivals.append(f"{rival.name_fr} (Eco:{rival.economy}, Mil:{rival.military})")
 
         wars = []
-        for enemy_id in player.at_war:
+        for enemy_id in sorted(player.at_war):
             enemy = world.get_country(enemy_id)
             if enemy:
                 wars.append(enemy.name_fr)
@@ -512,7 +512,7 @@ CONTEXTE MONDIAL:
         conflicts = []
         for c in world.countries.values():
             if c.at_war and c.id != player.id:
-                for enemy_id in c.at_war[:2]:
+                for enemy_id in sorted(c.at_war)[:2]:
                     enemy = world.get_country(enemy_id)
                     if enemy:
                         conflicts.append(f"{c.name_fr} vs {enemy.name_fr}")
@@ -62,7 +62,7 @@ class AIEventGenerator:
         active_wars = []
         for c in world.countries.values():
             if c.at_war:
-                for enemy_id in c.at_war:
+                for enemy_id in sorted(c.at_war):
                     war_pair = tuple(sorted([c.id, enemy_id]))
                     if war_pair not in active_wars:
                         active_wars.append(war_pair)
@@ -85,7 +85,7 @@ class AIEventGenerator:
 
         # Player's situation
         player_wars = []
-        for enemy_id in player.at_war:
+        for enemy_id in sorted(player.at_war):
             enemy = world.get_country(enemy_id)
             if enemy:
                 player_wars.append(enemy.name_fr)
@@ -107,7 +107,7 @@ class AIEventGenerator:
         for ally_id in player.allies:
             ally = world.get_country(ally_id)
             if ally and ally.at_war:
-                for enemy_id in ally.at_war:
+                for enemy_id in sorted(ally.at_war):
                     if enemy_id not in player.at_war:
                         enemy = world.get_country(enemy_id)
                         if enemy:
@@ -173,7 +173,7 @@ Commande a analyser: "{command}"
                 economy=country.economy,
                 military=country.military,
                 stability=country.stability,
-                at_war=", ".join(country.at_war) if country.at_war else "personne",
+                at_war=", ".join(sorted(country.at_war)) if country.at_war else "personne",
                 allies=", ".join(country.allies) if country.allies else "aucun",
                 active_projects="aucun",  # TODO: integrate projects
                 command=command
@@ -593,11 +593,10 @@ Commande a analyser: "{command}"
 
         # Execute action-specific logic
         if action == CommandAction.ATTACK and target_id:
-            if target_id not in country.at_war:
-                country.at_war.append(target_id)
+            country.at_war.add(target_id)
             target = world.get_country(target_id)
-            if target and country.id not in target.at_war:
-                target.at_war.append(country.id)
+            if target:
+                target.at_war.add(country.id)
 
             events.append(Event(
                 id=f"war_{world.year}_{country.id}_{target_id}",
@@ -612,11 +611,10 @@ Commande a analyser: "{command}"
             ))
 
         elif action == CommandAction.DECLARE_WAR and target_id:
-            if target_id not in country.at_war:
-                country.at_war.append(target_id)
+            country.at_war.add(target_id)
             target = world.get_country(target_id)
-            if target and country.id not in target.at_war:
-                target.at_war.append(country.id)
+            if target:
+                target.at_war.add(country.id)
             country.modify_relation(target_id, -50)
 
             events.append(Event(
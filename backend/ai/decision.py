@@ -3,6 +3,7 @@ import logging
 import random
 from typing import List, Optional, Tuple, Dict
 from collections import defaultdict
+from itertools import islice
 
 from engine.country import Country
 from engine.world import World
@@ -199,7 +200,11 @@ def _evaluate_options(country: Country, world: World, mood: int = 50) -> List[Tu
 
     # Reconciliation option (reduce tensions with non-allies when peaceful)
     if mood > 60:
-        for other_id, relation in list(country.relations.items())[:5]:
+        # First five other countries; relations only hold non-neutral
+        # entries, so take the order from the world, not the dict
+        others = islice((oid for oid in world.countries if oid != country.id), 5)
+        for other_id in others:
+            relation = country.relations.get(other_id, 0)
             if relation < -20 and other_id not in country.at_war:
                 other = world.get_country(other_id)
                 if other and other_id not in country.rivals:
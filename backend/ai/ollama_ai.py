@@ -50,16 +50,12 @@ class DecisionCache:
 
     def _hash_situation(self, country: Country, world: World) -> str:
         """Create hash of relevant situation factors"""
-        factors = [
-            country.economy // 10,  # Round to reduce cache misses
-            country.military // 10,
-            country.stability // 10,
-            len(country.at_war),
-            len(country.rivals),
-            world.global_tension // 20,
-            world.defcon_level,
-        ]
-        return "_".join(str(f) for f in factors)
+        # Stats rounded to reduce cache misses; one f-string, no temporary list
+        return (
+            f"{country.economy // 10}_{country.military // 10}_{country.stability // 10}_"
+            f"{len(country.at_war)}_{len(country.rivals)}_"
+            f"{world.global_tension // 20}_{world.defcon_level}"
+        )
 
     def get(self, country: Country, world: World) -> Optional[Dict[str, Any]]:
         """Get cached decision if valid"""
@@ -376,7 +372,7 @@ class OllamaAI:
         # Active conflicts
         conflicts_info = ""
         if country.at_war:
-            enemies = [world.get_country(e) for e in country.at_war]
+            enemies = [world.get_country(e) for e in sorted(country.at_war)]
             enemies_names = [e.name_fr for e in enemies if e]
             conflicts_info = f"\nEN GUERRE AVEC: {', '.join(enemies_names)}"
 
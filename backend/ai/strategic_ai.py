@@ -81,7 +81,7 @@ class StrategicAI:
 
         # Check for war
         if country.at_war:
-            for enemy_id in country.at_war:
+            for enemy_id in sorted(country.at_war):
                 enemy = world.get_country(enemy_id)
                 if enemy:
                     power_diff = enemy.get_power_score() - country.get_power_score()
@@ -595,7 +595,7 @@ async def get_geopolitical_analysis(world: World) -> Dict[str, Any]:
     conflicts = []
     seen_conflicts = set()
     for country in world.countries.values():
-        for enemy_id in country.at_war:
+        for enemy_id in sorted(country.at_war):
             conflict_key = tuple(sorted([country.id, enemy_id]))
             if conflict_key not in seen_conflicts:
                 seen_conflicts.add(conflict_key)
@@ -88,7 +88,7 @@ async def get_bloc_members_detailed(bloc_id: str):
     for member_id in bloc.members:
         country = world.get_country(member_id)
         if country:
-            members.append(CountryResponse.from_country(country))
+            members.append(CountryResponse.from_country(country, world))
 
     return members
 
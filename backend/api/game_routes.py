@@ -69,7 +69,7 @@ async def get_state():
     world = get_world()
     timeline = get_timeline()
 
-    countries = [CountryResponse.from_country(c) for c in world.countries.values()]
+    countries = [CountryResponse.from_country(c, world) for c in world.countries.values()]
     zones = [InfluenceZoneResponse.from_zone(z) for z in world.influence_zones.values()]
     conflicts = [
         ConflictResponse(
@@ -166,7 +166,7 @@ async def get_country(country_id: str):
     country = world.get_country(country_id.upper())
     if not country:
         raise HTTPException(status_code=404, detail=f"Country {country_id} not found")
-    return CountryResponse.from_country(country)
+    return CountryResponse.from_country(country, world)
 
 
 @router.get("/events", response_model=list[EventResponse])
@@ -387,14 +387,14 @@ async def get_influence_zones():
 async def get_superpowers():
     """Get tier 1 superpowers"""
     world = get_world()
-    return [CountryResponse.from_country(c) for c in world.get_superpowers()]
+    return [CountryResponse.from_country(c, world) for c in world.get_superpowers()]
 
 
 @router.get("/nuclear-powers", response_model=list[CountryResponse])
 async def get_nuclear_powers():
     """Get all nuclear-armed countries"""
     world = get_world()
-    return [CountryResponse.from_country(c) for c in world.get_nuclear_powers()]
+    return [CountryResponse.from_country(c, world) for c in world.get_nuclear_powers()]
 
 
 @router.get("/bloc/{bloc_name}", response_model=list[CountryResponse])
@@ -404,7 +404,7 @@ async def get_bloc_members(bloc_name: str):
     members = world.get_bloc_members(bloc_name.upper())
     if not members:
         raise HTTPException(status_code=404, detail=f"Bloc {bloc_name} not found or empty")
-    return [CountryResponse.from_country(c) for c in members]
+    return [CountryResponse.from_country(c, world) for c in members]
 
 
 # Phase 13: Unified architecture management endpoints
@@ -78,6 +78,16 @@ def get_world() -> Union[World, UnifiedWorld]:
     return _world
 
 
+def get_tier_country(world: Union[World, UnifiedWorld], tier: int, country_id: str):
+    """Get a Tier 4-6 country by ID from either world type"""
+    if isinstance(world, UnifiedWorld):
+        country = world.get_country(country_id)
+        return country if country is not None and country.tier == tier else None
+    # Legacy ids can repeat across tiers (e.g. SYR), so read the tier's own dict
+    tier_dicts = {4: world.tier4_countries, 5: world.tier5_countries, 6: world.tier6_countries}
+    return tier_dicts[tier].get(country_id)
+
+
 def get_event_pool() -> EventPool:
     """Get or initialize event pool"""
     global _event_pool
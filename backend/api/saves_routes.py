@@ -140,7 +140,7 @@ async def save_game(request: SaveGameRequest):
         )
 
         # Serialize world state
-        world_state = world.model_dump()
+        world_state = world.model_dump(mode="json")
 
         # Create save data
         save_data = {
@@ -400,7 +400,7 @@ async def create_autosave():
         save_data = {
             "metadata": metadata,
             "settings": settings.model_dump(),
-            "world_state": world.model_dump(),
+            "world_state": world.model_dump(mode="json"),
             "player_country": player_country,
         }
 
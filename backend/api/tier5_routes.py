@@ -3,7 +3,7 @@ from typing import Optional
 from fastapi import APIRouter, HTTPException
 
 from schemas.game import Tier5CountryResponse, Tier5SummaryResponse
-from api.game_state import get_world
+from api.game_state import get_tier_country, get_world
 
 router = APIRouter(prefix="/api", tags=["tier5"])
 
@@ -40,24 +40,23 @@ async def get_tier5_summary():
     world = get_world()
     countries = list(world.tier5_countries.values())
 
+    # Single pass over the tier for every breakdown
     by_region = {}
-    for c in countries:
-        by_region[c.region] = by_region.get(c.region, 0) + 1
-
     by_alignment = {}
+    by_protector = {}
+    in_crisis_count = pro_west = pro_east = 0
     for c in countries:
+        by_region[c.region] = by_region.get(c.region, 0) + 1
         label = c.get_alignment_label()
         by_alignment[label] = by_alignment.get(label, 0) + 1
-
-    by_protector = {}
-    for c in countries:
         if c.protector:
             by_protector[c.protector] = by_protector.get(c.protector, 0) + 1
-
-    in_crisis_count = len([c for c in countries if c.in_crisis])
-
-    pro_west = len([c for c in countries if c.alignment < -30])
-    pro_east = len([c for c in countries if c.alignment > 30])
+        if c.in_crisis:
+            in_crisis_count += 1
+        if c.alignment < -30:
+            pro_west += 1
+        elif c.alignment > 30:
+            pro_east += 1
     neutral = len(countries) - pro_west - pro_east
 
     return Tier5SummaryResponse(
@@ -76,7 +75,7 @@ async def get_tier5_summary():
 async def get_tier5_country(country_id: str):
     """Get details of a specific Tier 5 country"""
     world = get_world()
-    country = world.get_tier5_country(country_id.upper())
+    country = get_tier_country(world, 5, country_id.upper())
     if not country:
         raise HTTPException(status_code=404, detail=f"Tier 5 country {country_id} not found")
     return Tier5CountryResponse.from_tier5_country(country)
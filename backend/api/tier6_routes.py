@@ -3,7 +3,7 @@ from typing import Optional
 from fastapi import APIRouter, HTTPException
 
 from schemas.game import Tier6CountryResponse, Tier6SummaryResponse
-from api.game_state import get_world
+from api.game_state import get_tier_country, get_world
 from ai.decision_tier6 import get_protector_influence
 
 router = APIRouter(prefix="/api", tags=["tier6"])
@@ -41,21 +41,19 @@ async def get_tier6_summary():
     world = get_world()
     countries = list(world.tier6_countries.values())
 
+    # Single pass over the tier for every breakdown
     by_region = {}
-    for c in countries:
-        by_region[c.region] = by_region.get(c.region, 0) + 1
-
     by_protector = {}
+    by_status = {}
+    territories = 0
     for c in countries:
+        by_region[c.region] = by_region.get(c.region, 0) + 1
         if c.protector:
             by_protector[c.protector] = by_protector.get(c.protector, 0) + 1
-
-    by_status = {}
-    for c in countries:
         if c.special_status:
             by_status[c.special_status] = by_status.get(c.special_status, 0) + 1
-
-    territories = len([c for c in countries if c.is_territory])
+        if c.is_territory:
+            territories += 1
     sovereign = len(countries) - territories
 
     return Tier6SummaryResponse(
@@ -72,7 +70,7 @@ async def get_tier6_summary():
 async def get_tier6_country(country_id: str):
     """Get details of a specific Tier 6 country"""
     world = get_world()
-    country = world.get_tier6_country(country_id.upper())
+    country = get_tier_country(world, 6, country_id.upper())
     if not country:
         raise HTTPException(status_code=404, detail=f"Tier 6 country {country_id} not found")
     return Tier6CountryResponse.from_tier6_country(country)
@@ -82,7 +80,7 @@ async def get_tier6_country(country_id: str):
 async def get_tier6_influence(country_id: str):
     """Get influence information for a Tier 6 country based on its protector"""
     world = get_world()
-    country = world.get_tier6_country(country_id.upper())
+    country = get_tier_country(world, 6, country_id.upper())
     if not country:
         raise HTTPException(status_code=404, detail=f"Tier 6 country {country_id} not found")
     return get_protector_influence(country, world)
@@ -1,5 +1,5 @@
 """Unified country model for all tiers - Phase 12 Architecture Unification"""
-from typing import Dict, List, Optional, Literal, Union
+from typing import Dict, List, Optional, Literal, Set, Union
 from pydantic import BaseModel, Field, computed_field
 
 
@@ -51,7 +51,8 @@ class BaseCountry(BaseModel):
     tier: int = Field(default=4, ge=1, le=6)
     region: str = "unknown"
 
-    # Base stats (present for all tiers)
+    # Base stats (present for all tiers). Stats bounded to -100..100 are
+    # CPython's shared small ints, so they cost no per-country allocation.
     economy: int = Field(default=50, ge=0, le=100)
     stability: int = Field(default=50, ge=0, le=100)
     population: int = Field(default=10, ge=0)
@@ -98,7 +99,7 @@ class BaseCountry(BaseModel):
 
     # Conflict state
     sanctions_on: List[str] = Field(default_factory=list)
-    at_war: List[str] = Field(default_factory=list)
+    at_war: Set[str] = Field(default_factory=set)
 
     # Crisis state (Tier 4-6)
     in_crisis: bool = False
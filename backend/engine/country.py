@@ -1,5 +1,5 @@
 """Country model for Historia Lite"""
-from typing import Dict, List, Optional, Literal
+from typing import Dict, List, Optional, Literal, Set
 from pydantic import BaseModel, Field
 
 
@@ -100,7 +100,7 @@ class Country(BaseModel):
 
     # Conflict state
     sanctions_on: List[str] = Field(default_factory=list)
-    at_war: List[str] = Field(default_factory=list)
+    at_war: Set[str] = Field(default_factory=set)
     allies: List[str] = Field(default_factory=list)
     rivals: List[str] = Field(default_factory=list)
 
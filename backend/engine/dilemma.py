@@ -561,7 +561,7 @@ class DilemmaManager:
         for ally_id in country.allies:
             ally = world.countries.get(ally_id)
             if ally and ally.at_war:
-                for attacker_id in ally.at_war:
+                for attacker_id in sorted(ally.at_war):
                     if attacker_id not in country.at_war:
                         if not self._has_pending_dilemma(
                             country.id, DilemmaType.ALLY_ATTACKED
@@ -579,7 +579,7 @@ class DilemmaManager:
 
         # War declared on this country
         if country.at_war:
-            for enemy_id in country.at_war:
+            for enemy_id in sorted(country.at_war):
                 if not self._has_pending_dilemma(
                     country.id, DilemmaType.WAR_DECLARATION
                 ):
@@ -763,8 +763,9 @@ class DilemmaManager:
         # Apply relation effects
         relation_changes = {}
         for target_id, change in chosen.relation_effects.items():
-            if target_id in country.relations:
-                old_rel = country.relations[target_id]
+            # Neutral relations are not stored, so fall back to a country lookup
+            if target_id in country.relations or world.get_country(target_id):
+                old_rel = country.get_relation(target_id)
                 new_rel = max(-100, min(100, old_rel + change))
                 country.relations[target_id] = new_rel
                 relation_changes[target_id] = change
@@ -774,10 +775,10 @@ class DilemmaManager:
 
         if chosen.declares_war:
             if chosen.declares_war not in country.at_war:
-                country.at_war.append(chosen.declares_war)
+                country.at_war.add(chosen.declares_war)
                 target = world.countries.get(chosen.declares_war)
-                if target and country.id not in target.at_war:
-                    target.at_war.append(country.id)
+                if target:
+                    target.at_war.add(country.id)
                 events_triggered.append({
                     "type": "war_declaration",
                     "attacker": country.id,
@@ -790,8 +791,8 @@ class DilemmaManager:
                 if dilemma.related_country_id in country.at_war:
                     country.at_war.remove(dilemma.related_country_id)
                     target = world.countries.get(dilemma.related_country_id)
-                    if target and country.id in target.at_war:
-                        target.at_war.remove(country.id)
+                    if target:
+                        target.at_war.discard(country.id)
                     events_triggered.append({
                         "type": "peace",
                         "parties": [country.id, dilemma.related_country_id]
@@ -136,7 +136,7 @@ class ProceduralEventGenerator:
                 continue
 
             ally_at_war = getattr(ally, 'at_war', []) or []
-            for enemy_id in ally_at_war:
+            for enemy_id in sorted(ally_at_war):
                 if enemy_id in at_war:
                     continue  # Already at war with them
 
@@ -241,6 +241,8 @@ class ScenarioManager:
                 for stat, value in mods.items():
                     if hasattr(country, stat):
                         setattr(country, stat, value)
+        # Modifications can move countries between tiers
+        world.refresh_indexes()
 
     def check_objectives(self, world) -> List[dict]:
         """
@@ -695,10 +695,12 @@ def _process_influence(world: World) -> List[Event]:
 def _update_relations(world: World) -> None:
     """Phase 7: Update diplomatic relations"""
     for country in world.countries.values():
-        for other_id, relation in list(country.relations.items()):
-            other = world.get_country(other_id)
-            if not other:
+        # Neutral relations are not stored, so walk every country: sanctions
+        # and rivalries must still erode a relation sitting at 0
+        for other_id, other in world.countries.items():
+            if other_id == country.id:
                 continue
+            relation = country.relations.get(other_id, 0)
 
             # Same bloc improves relations
             if country.shares_bloc(other):
@@ -1415,9 +1417,9 @@ def _process_influence_monthly(
 def _update_relations_monthly(world: World) -> None:
     """Monthly relation drift (smaller changes)"""
     for country in world.countries.values():
-        for other_id, relation in list(country.relations.items()):
-            other = world.get_country(other_id)
-            if not other:
+        # Visit neutral pairs too (see _update_relations)
+        for other_id, other in world.countries.items():
+            if other_id == country.id:
                 continue
 
             # Same bloc improves relations (quarterly)
@@ -1,11 +1,20 @@
 """World state for Historia Lite"""
-import json
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import total_ordering
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Deque, Dict, Iterable, List, Mapping, Optional, Sequence, Union
 
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel, Field, GetCoreSchemaHandler, TypeAdapter,
+    computed_field, field_validator,
+)
+from pydantic_core import core_schema
+from typing_extensions import TypedDict
 
 from .country import Country, Tier4Country, Tier5Country, Tier6Country
 from .region import InfluenceZone, Region
@@ -14,6 +23,22 @@ from .events import Event
 logger = logging.getLogger(__name__)
 
 
+def _tier_file_adapter(country_cls: type) -> TypeAdapter:
+    """Adapter for the {"countries": [...]} layout of the Tier 4-6 files"""
+    return TypeAdapter(TypedDict(
+        f"{country_cls.__name__}File", {"countries": List[country_cls]}, total=False
+    ))
+
+
+# Built once: validating raw JSON bytes lets pydantic-core parse and build
+# the models in a single pass, without an intermediate list of dicts.
+_COUNTRY_LIST_ADAPTER = TypeAdapter(List[Country])
+_TIER4_FILE_ADAPTER = _tier_file_adapter(Tier4Country)
+_TIER5_FILE_ADAPTER = _tier_file_adapter(Tier5Country)
+_TIER6_FILE_ADAPTER = _tier_file_adapter(Tier6Country)
+_ZONE_LIST_ADAPTER = TypeAdapter(List[InfluenceZone])
+
+
 # Month names for display
 MONTH_NAMES_EN = [
     "January", "February", "March", "April", "May", "June",
@@ -25,11 +50,53 @@ MONTH_NAMES_FR = [
 ]
 
 
-class GameDate(BaseModel):
-    """Represents a specific date in the game timeline"""
-    year: int
-    month: int = 1  # 1-12
-    day: int = 1    # 1-31
+@total_ordering
+class GameDate:
+    """
+    Represents a specific date in the game timeline.
+
+    Dates are built and compared constantly during a tick, so this is a
+    slotted plain class rather than a pydantic model. Year and month are
+    packed once into ``_months`` so comparisons are a single int compare.
+    Pydantic models can still declare ``GameDate`` fields: they validate
+    from ``{"year", "month", "day"}`` dicts and serialize back to them.
+    """
+    __slots__ = ("year", "month", "day", "_months")
+
+    def __init__(self, year: int, month: int = 1, day: int = 1) -> None:
+        self.year = year
+        self.month = month  # 1-12
+        self.day = day      # 1-31
+        self._months = year * 12 + month - 1
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        fields_schema = core_schema.typed_dict_schema({
+            "year": core_schema.typed_dict_field(core_schema.int_schema()),
+            "month": core_schema.typed_dict_field(core_schema.int_schema(), required=False),
+            "day": core_schema.typed_dict_field(core_schema.int_schema(), required=False),
+        })
+        from_dict = core_schema.no_info_after_validator_function(
+            lambda data: cls(**data), fields_schema
+        )
+        return core_schema.json_or_python_schema(
+            json_schema=from_dict,
+            python_schema=core_schema.union_schema(
+                [core_schema.is_instance_schema(cls), from_dict]
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls.to_dict, return_schema=fields_schema
+            ),
+        )
+
+    def to_dict(self) -> dict:
+        """Serialize as {year, month, day} (same shape as the former model)"""
+        return {"year": self.year, "month": self.month, "day": self.day}
+
+    def __repr__(self) -> str:
+        return f"GameDate(year={self.year}, month={self.month}, day={self.day})"
 
     def __str__(self) -> str:
         """Format: 'February 15, 2025'"""
@@ -46,39 +113,40 @@ class GameDate(BaseModel):
         return f"{MONTH_NAMES_EN[self.month - 1]} {self.year}"
 
     def to_ordinal(self) -> int:
-        """Convert to ordinal days for comparisons (approximate)"""
-        return self.year * 365 + self.month * 30 + self.day
+        """Convert to an integer sort key (day-exact, not a day count)"""
+        return self._months * 32 + self.day
 
     def to_months(self) -> int:
         """Convert to total months for easier comparisons"""
-        return self.year * 12 + self.month
+        return self._months + 1
 
     def __lt__(self, other: "GameDate") -> bool:
-        return self.to_ordinal() < other.to_ordinal()
-
-    def __le__(self, other: "GameDate") -> bool:
-        return self.to_ordinal() <= other.to_ordinal()
-
-    def __gt__(self, other: "GameDate") -> bool:
-        return self.to_ordinal() > other.to_ordinal()
-
-    def __ge__(self, other: "GameDate") -> bool:
-        return self.to_ordinal() >= other.to_ordinal()
+        if not isinstance(other, GameDate):
+            return NotImplemented
+        if self._months != other._months:
+            return self._months < other._months
+        return self.day < other.day
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, GameDate):
             return False
-        return self.year == other.year and self.month == other.month and self.day == other.day
+        return self._months == other._months and self.day == other.day
 
     def __hash__(self) -> int:
-        return hash((self.year, self.month, self.day))
+        return self.to_ordinal()
 
     def add_months(self, months: int) -> "GameDate":
         """Return a new GameDate with months added"""
-        total_months = self.year * 12 + (self.month - 1) + months
-        new_year = total_months // 12
-        new_month = (total_months % 12) + 1
-        return GameDate(year=new_year, month=new_month, day=self.day)
+        total_months = self._months + months
+        return GameDate(total_months // 12, (total_months % 12) + 1, self.day)
+
+    def add_months_batch(self, offsets: Iterable[int]) -> List["GameDate"]:
+        """Return one GameDate per month offset (bulk event scheduling)"""
+        base, day = self._months, self.day
+        return [
+            GameDate(year, month + 1, day)
+            for year, month in (divmod(base + offset, 12) for offset in offsets)
+        ]
 
     def subtract_months(self, months: int) -> "GameDate":
         """Return a new GameDate with months subtracted"""
@@ -86,11 +154,11 @@ class GameDate(BaseModel):
 
     def months_between(self, other: "GameDate") -> int:
         """Calculate months between two dates"""
-        return abs(self.to_months() - other.to_months())
+        return abs(self._months - other._months)
 
     def months_since(self, other: "GameDate") -> int:
         """Calculate months since another date (can be negative)"""
-        return self.to_months() - other.to_months()
+        return self._months - other._months
 
 
 class GeopoliticalEra(str, Enum):
@@ -128,6 +196,51 @@ ERA_NAMES_EN = {
     GeopoliticalEra.MULTIPOLAR_SHIFT: "Multipolar Shift",
 }
 
+# Gameplay effects of each era (shared, read-only)
+_ERA_EFFECTS: Mapping[GeopoliticalEra, Mapping[str, Any]] = MappingProxyType({
+    GeopoliticalEra.EQUILIBRIUM: MappingProxyType({
+        "description_fr": "Aucun modificateur particulier",
+        "war_cost_modifier": 1.0,
+        "diplomacy_success_modifier": 1.0,
+        "sanctions_effectiveness": 1.0,
+    }),
+    GeopoliticalEra.ALLIANCE_BUILDING: MappingProxyType({
+        "description_fr": "Les alliances se forment plus facilement",
+        "alliance_formation_bonus": 0.3,
+        "diplomacy_success_modifier": 1.2,
+    }),
+    GeopoliticalEra.SANCTIONS_ERA: MappingProxyType({
+        "description_fr": "Sanctions +50% efficaces, degats militaires -30%",
+        "sanctions_effectiveness": 1.5,
+        "military_damage_modifier": 0.7,
+    }),
+    GeopoliticalEra.MILITARY_BUILDUP: MappingProxyType({
+        "description_fr": "Depenses militaires reduites, tensions accrues",
+        "military_cost_modifier": 0.8,
+        "tension_increase_modifier": 1.3,
+    }),
+    GeopoliticalEra.DETENTE: MappingProxyType({
+        "description_fr": "+30% succes diplomatique, guerre plus couteuse",
+        "diplomacy_success_modifier": 1.3,
+        "war_cost_modifier": 1.5,
+    }),
+    GeopoliticalEra.CRISIS_MODE: MappingProxyType({
+        "description_fr": "Instabilite generalisee, tout est plus volatile",
+        "stability_decay_modifier": 1.5,
+        "market_volatility_bonus": 20,
+    }),
+    GeopoliticalEra.COLD_WAR: MappingProxyType({
+        "description_fr": "Bipolarisation, proxy wars facilites",
+        "bloc_cohesion_bonus": 0.2,
+        "proxy_war_cost_modifier": 0.6,
+    }),
+    GeopoliticalEra.MULTIPOLAR_SHIFT: MappingProxyType({
+        "description_fr": "Nouveaux acteurs emergent, alliances fluides",
+        "new_alliance_bonus": 0.4,
+        "bloc_cohesion_penalty": 0.2,
+    }),
+})
+
 
 class WorldMood(BaseModel):
     """
@@ -160,52 +273,9 @@ class WorldMood(BaseModel):
             return ERA_NAMES_FR.get(self.current_era, self.current_era.value)
         return ERA_NAMES_EN.get(self.current_era, self.current_era.value)
 
-    def get_era_effects(self) -> dict:
-        """Get gameplay effects of current era"""
-        effects = {
-            GeopoliticalEra.EQUILIBRIUM: {
-                "description_fr": "Aucun modificateur particulier",
-                "war_cost_modifier": 1.0,
-                "diplomacy_success_modifier": 1.0,
-                "sanctions_effectiveness": 1.0,
-            },
-            GeopoliticalEra.ALLIANCE_BUILDING: {
-                "description_fr": "Les alliances se forment plus facilement",
-                "alliance_formation_bonus": 0.3,
-                "diplomacy_success_modifier": 1.2,
-            },
-            GeopoliticalEra.SANCTIONS_ERA: {
-                "description_fr": "Sanctions +50% efficaces, degats militaires -30%",
-                "sanctions_effectiveness": 1.5,
-                "military_damage_modifier": 0.7,
-            },
-            GeopoliticalEra.MILITARY_BUILDUP: {
-                "description_fr": "Depenses militaires reduites, tensions accrues",
-                "military_cost_modifier": 0.8,
-                "tension_increase_modifier": 1.3,
-            },
-            GeopoliticalEra.DETENTE: {
-                "description_fr": "+30% succes diplomatique, guerre plus couteuse",
-                "diplomacy_success_modifier": 1.3,
-                "war_cost_modifier": 1.5,
-            },
-            GeopoliticalEra.CRISIS_MODE: {
-                "description_fr": "Instabilite generalisee, tout est plus volatile",
-                "stability_decay_modifier": 1.5,
-                "market_volatility_bonus": 20,
-            },
-            GeopoliticalEra.COLD_WAR: {
-                "description_fr": "Bipolarisation, proxy wars facilites",
-                "bloc_cohesion_bonus": 0.2,
-                "proxy_war_cost_modifier": 0.6,
-            },
-            GeopoliticalEra.MULTIPOLAR_SHIFT: {
-                "description_fr": "Nouveaux acteurs emergent, alliances fluides",
-                "new_alliance_bonus": 0.4,
-                "bloc_cohesion_penalty": 0.2,
-            },
-        }
-        return effects.get(self.current_era, effects[GeopoliticalEra.EQUILIBRIUM])
+    def get_era_effects(self) -> Mapping[str, Any]:
+        """Get gameplay effects of current era (read-only mapping)"""
+        return _ERA_EFFECTS.get(self.current_era, _ERA_EFFECTS[GeopoliticalEra.EQUILIBRIUM])
 
     def to_dict(self) -> dict:
         """Serialize for API/frontend"""
@@ -221,7 +291,7 @@ class WorldMood(BaseModel):
             "era_display_en": self.get_era_display("en"),
             "era_strength": self.era_strength,
             "era_months_active": self.era_months_active,
-            "era_effects": self.get_era_effects(),
+            "era_effects": dict(self.get_era_effects()),
             "player_reputation": self.player_reputation,
         }
 
@@ -238,6 +308,15 @@ class Conflict(BaseModel):
     nuclear_risk: int = Field(default=0, ge=0, le=100)
 
 
+def _empty_attribute_index() -> Dict[str, Dict[Any, List[Any]]]:
+    """One empty reverse index per indexed attribute (see World._index_country)"""
+    return {"tier": {}, "bloc": {}, "region": {}, "protector": {}, "influence_zone": {}}
+
+
+# Only the tail of the event history is ever read; older events are dropped
+MAX_EVENTS_HISTORY = 2000
+
+
 class World(BaseModel):
     """The complete game world state"""
     # Timeline - now with month granularity
@@ -257,7 +336,9 @@ class World(BaseModel):
     influence_zones: Dict[str, InfluenceZone] = Field(default_factory=dict)
 
     active_conflicts: List[Conflict] = Field(default_factory=list)
-    events_history: List[Event] = Field(default_factory=list)
+    events_history: Deque[Event] = Field(
+        default_factory=lambda: deque(maxlen=MAX_EVENTS_HISTORY)
+    )
 
     # Active projects by country_id
     active_projects: Dict[str, List] = Field(default_factory=dict)
@@ -292,27 +373,139 @@ class World(BaseModel):
     # Player tracking
     player_country_id: Optional[str] = None
 
+    # Lookup indexes over the tier dicts, rebuilt in model_post_init and
+    # kept up to date by _register_country. They are excluded fields rather
+    # than PrivateAttr because private attributes are resolved through
+    # BaseModel.__getattr__, which is several times slower than a field read.
+    country_index: Dict[str, Any] = Field(default_factory=dict, exclude=True, repr=False)
+    # Reverse indexes on tier, bloc, region, protector and influence zone:
+    # index name -> key -> countries, in tier dict order (see _index_country).
+    # Code that writes one of these attributes directly (scenario start sets
+    # tier) must call refresh_indexes().
+    attribute_index: Dict[str, Dict[Any, List[Any]]] = Field(
+        default_factory=_empty_attribute_index, exclude=True, repr=False
+    )
+    # Date labels read on every state poll, keyed on the current and start
+    # dates so any calendar change (advance_month, scenario start) refreshes them
+    date_cache: tuple = Field(default=(), exclude=True, repr=False)
+    # Entries across the four tier dicts (an id present in two tiers counts
+    # twice), maintained alongside the indexes
+    country_count: int = Field(default=0, exclude=True, repr=False)
+    # active_conflicts by id (the oldest on a repeated id); the list stays
+    # the ordered source of truth
+    conflict_index: Dict[str, Conflict] = Field(default_factory=dict, exclude=True, repr=False)
+
+    @field_validator("events_history", mode="after")
+    @classmethod
+    def _bound_events_history(cls, value: Deque[Event]) -> Deque[Event]:
+        """Restore the size bound on histories loaded from saves"""
+        return deque(value, maxlen=MAX_EVENTS_HISTORY)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild every lookup index from the tier dicts"""
+        # Cleared in place: reassigning a field goes through
+        # BaseModel.__setattr__ and would cost more than an empty build
+        self.country_index.clear()
+        for index in self.attribute_index.values():
+            index.clear()
+        count = 0
+        for tier_dict in (self.countries, self.tier4_countries,
+                          self.tier5_countries, self.tier6_countries):
+            count += len(tier_dict)
+            for country in tier_dict.values():
+                self._index_country(country)
+        if count != self.country_count:
+            self.country_count = count
+        self.conflict_index.clear()
+        for conflict in self.active_conflicts:
+            self.conflict_index.setdefault(conflict.id, conflict)
+
+    def refresh_indexes(self) -> None:
+        """Re-file every country after indexed attributes were written directly"""
+        self._rebuild_indexes()
+
+    def _index_country(self, country) -> None:
+        """Add one country to the lookup indexes"""
+        # Tier 1-3 entries win on duplicate ids
+        existing = self.country_index.get(country.id)
+        if existing is None or existing.tier >= country.tier:
+            self.country_index[country.id] = country
+
+        index = self.attribute_index
+        if country.tier <= 3:
+            index["tier"].setdefault(country.tier, []).append(country)
+            for bloc in country.blocs:
+                index["bloc"].setdefault(bloc, []).append(country)
+            return
+
+        index["region"].setdefault((country.tier, country.region), []).append(country)
+        # Tier 4 countries have no protector or influence zone
+        protector = getattr(country, "protector", None)
+        if protector:
+            index["protector"].setdefault((country.tier, protector), []).append(country)
+        zone = getattr(country, "influence_zone", None)
+        if zone:
+            index["influence_zone"].setdefault(zone, []).append(country)
+
+    def _register_country(self, country) -> None:
+        """Add a country of any tier to its tier dict and to the indexes"""
+        if country.tier <= 3:
+            tier_dict = self.countries
+        elif country.tier == 4:
+            tier_dict = self.tier4_countries
+        elif country.tier == 5:
+            tier_dict = self.tier5_countries
+        else:
+            tier_dict = self.tier6_countries
+
+        replaced = country.id in tier_dict
+        tier_dict[country.id] = country
+        if replaced:
+            self._rebuild_indexes()
+        else:
+            self._index_country(country)
+            self.country_count += 1
+
+    @computed_field(repr=False)
     @property
     def current_date(self) -> GameDate:
         """Get current date as GameDate object"""
         return GameDate(year=self.year, month=self.month, day=self.day)
 
+    def _date_labels(self) -> tuple:
+        """Cached (key, FR label, EN label, months elapsed)"""
+        key = (self.year, self.month, self.start_year, self.start_month)
+        cache = self.date_cache
+        if not cache or cache[0] != key:
+            elapsed = (self.year * 12 + self.month) - (self.start_year * 12 + self.start_month)
+            cache = self.date_cache = (
+                key,
+                f"{MONTH_NAMES_FR[self.month - 1]} {self.year}",
+                f"{MONTH_NAMES_EN[self.month - 1]} {self.year}",
+                elapsed,
+            )
+        return cache
+
+    @computed_field(repr=False)
     @property
     def date_display(self) -> str:
         """Format for UI display: 'Février 2025'"""
-        return f"{MONTH_NAMES_FR[self.month - 1]} {self.year}"
+        return self._date_labels()[1]
 
+    @computed_field(repr=False)
     @property
     def date_display_en(self) -> str:
         """Format for UI display: 'February 2025'"""
-        return f"{MONTH_NAMES_EN[self.month - 1]} {self.year}"
+        return self._date_labels()[2]
 
+    @computed_field(repr=False)
     @property
     def total_months_elapsed(self) -> int:
         """Total months since game start"""
-        start_months = self.start_year * 12 + self.start_month
-        current_months = self.year * 12 + self.month
-        return current_months - start_months
+        return self._date_labels()[3]
 
     def advance_month(self) -> None:
         """Advance the calendar by one month"""
@@ -333,11 +526,12 @@ class World(BaseModel):
 
     def get_superpowers(self) -> List[Country]:
         """Get tier 1 superpowers"""
-        return [c for c in self.countries.values() if c.tier == 1]
+        return list(self.attribute_index["tier"].get(1, ()))
 
     def get_major_powers(self) -> List[Country]:
         """Get tier 1 and 2 powers"""
-        return [c for c in self.countries.values() if c.tier <= 2]
+        tiers = self.attribute_index["tier"]
+        return [*tiers.get(1, ()), *tiers.get(2, ())]
 
     def get_nuclear_powers(self) -> List[Country]:
         """Get all nuclear-armed countries"""
@@ -345,7 +539,7 @@ class World(BaseModel):
 
     def get_bloc_members(self, bloc: str) -> List[Country]:
         """Get all countries in a bloc"""
-        return [c for c in self.countries.values() if bloc in c.blocs]
+        return list(self.attribute_index["bloc"].get(bloc, ()))
 
     def get_tier4_country(self, country_id: str) -> Optional[Tier4Country]:
         """Get a Tier 4 country by ID"""
@@ -357,7 +551,7 @@ class World(BaseModel):
 
     def get_tier4_by_region(self, region: str) -> List[Tier4Country]:
         """Get all Tier 4 countries in a specific region"""
-        return [c for c in self.tier4_countries.values() if c.region == region]
+        return list(self.attribute_index["region"].get((4, region), ()))
 
     def get_tier4_by_alignment(self, alignment_label: str) -> List[Tier4Country]:
         """Get Tier 4 countries by alignment label"""
@@ -375,7 +569,7 @@ class World(BaseModel):
 
     def get_tier5_by_region(self, region: str) -> List[Tier5Country]:
         """Get all Tier 5 countries in a specific region"""
-        return [c for c in self.tier5_countries.values() if c.region == region]
+        return list(self.attribute_index["region"].get((5, region), ()))
 
     def get_tier5_by_alignment(self, alignment_label: str) -> List[Tier5Country]:
         """Get Tier 5 countries by alignment label"""
@@ -384,8 +578,7 @@ class World(BaseModel):
 
     def get_tier5_by_protector(self, protector_id: str) -> List[Tier5Country]:
         """Get Tier 5 countries protected by a specific power"""
-        return [c for c in self.tier5_countries.values()
-                if c.protector == protector_id]
+        return list(self.attribute_index["protector"].get((5, protector_id), ()))
 
     # Tier 6 getters
     def get_tier6_country(self, country_id: str) -> Optional[Tier6Country]:
@@ -398,44 +591,24 @@ class World(BaseModel):
 
     def get_tier6_by_region(self, region: str) -> List[Tier6Country]:
         """Get all Tier 6 countries in a specific region"""
-        return [c for c in self.tier6_countries.values() if c.region == region]
+        return list(self.attribute_index["region"].get((6, region), ()))
 
     def get_tier6_by_protector(self, protector_id: str) -> List[Tier6Country]:
         """Get Tier 6 countries protected by a specific power"""
-        return [c for c in self.tier6_countries.values()
-                if c.protector == protector_id]
+        return list(self.attribute_index["protector"].get((6, protector_id), ()))
 
     # Universal getters
     def get_any_country(self, country_id: str):
         """Get any country by ID (searches all tiers)"""
-        if country_id in self.countries:
-            return self.countries[country_id]
-        if country_id in self.tier4_countries:
-            return self.tier4_countries[country_id]
-        if country_id in self.tier5_countries:
-            return self.tier5_countries[country_id]
-        if country_id in self.tier6_countries:
-            return self.tier6_countries[country_id]
-        return None
+        return self.country_index.get(country_id)
 
     def get_countries_by_influence_zone(self, zone_id: str) -> List:
         """Get all countries in a specific influence zone (Tier 4-6)"""
-        result = []
-        for c in self.tier4_countries.values():
-            if c.influence_zone == zone_id:
-                result.append(c)
-        for c in self.tier5_countries.values():
-            if c.influence_zone == zone_id:
-                result.append(c)
-        for c in self.tier6_countries.values():
-            if c.influence_zone == zone_id:
-                result.append(c)
-        return result
+        return list(self.attribute_index["influence_zone"].get(zone_id, ()))
 
     def get_all_countries_count(self) -> int:
         """Get total count of all countries (Tier 1-6)"""
-        return (len(self.countries) + len(self.tier4_countries) +
-                len(self.tier5_countries) + len(self.tier6_countries))
+        return self.country_count
 
     def add_event(self, event: Event) -> None:
         """Add an event to history"""
@@ -443,7 +616,13 @@ class World(BaseModel):
 
     def get_recent_events(self, count: int = 20) -> List[Event]:
         """Get most recent events"""
-        return self.events_history[-count:]
+        history = self.events_history
+        return list(islice(history, max(0, len(history) - count), None))
+
+    def _resolve_countries(self, country_ids: List[str]) -> List[Country]:
+        """Look up Tier 1-3 countries, skipping unknown ids"""
+        countries = self.countries
+        return [c for c in map(countries.get, country_ids) if c is not None]
 
     def start_conflict(
         self,
@@ -461,111 +640,102 @@ class World(BaseModel):
             region=region,
         )
 
-        for attacker_id in attacker_ids:
-            attacker = self.get_country(attacker_id)
-            if attacker:
-                for defender_id in defender_ids:
-                    if defender_id not in attacker.at_war:
-                        attacker.at_war.append(defender_id)
-
-        for defender_id in defender_ids:
-            defender = self.get_country(defender_id)
-            if defender:
-                for attacker_id in attacker_ids:
-                    if attacker_id not in defender.at_war:
-                        defender.at_war.append(attacker_id)
-
-        # Calculate nuclear risk
-        attackers = [self.get_country(cid) for cid in attacker_ids]
-        defenders = [self.get_country(cid) for cid in defender_ids]
-        if any(c and c.is_nuclear_power() for c in attackers + defenders):
+        # Resolve each side once; unknown ids are ignored
+        attackers = self._resolve_countries(attacker_ids)
+        defenders = self._resolve_countries(defender_ids)
+
+        for attacker in attackers:
+            attacker.at_war.update(defender_ids)
+        for defender in defenders:
+            defender.at_war.update(attacker_ids)
+
+        # Calculate nuclear risk. Arsenals change during play, so this reads
+        # the live countries and stops at the first nuclear power found.
+        if any(c.is_nuclear_power() for c in chain(attackers, defenders)):
             conflict.nuclear_risk = 20
 
         self.active_conflicts.append(conflict)
+        # A repeated matchup in the same year reuses the id; the index keeps
+        # the oldest, which is the one end_conflict ends first
+        self.conflict_index.setdefault(conflict.id, conflict)
         logger.info(f"Conflict started: {conflict.id}")
         return conflict
 
     def end_conflict(self, conflict_id: str) -> None:
         """End a conflict"""
-        conflict = next(
-            (c for c in self.active_conflicts if c.id == conflict_id), None
-        )
+        conflict = self.conflict_index.pop(conflict_id, None)
         if not conflict:
             return
 
-        for attacker_id in conflict.attackers:
-            attacker = self.get_country(attacker_id)
-            if attacker:
-                for defender_id in conflict.defenders:
-                    if defender_id in attacker.at_war:
-                        attacker.at_war.remove(defender_id)
-
-        for defender_id in conflict.defenders:
-            defender = self.get_country(defender_id)
-            if defender:
-                for attacker_id in conflict.attackers:
-                    if attacker_id in defender.at_war:
-                        defender.at_war.remove(attacker_id)
+        for attacker in self._resolve_countries(conflict.attackers):
+            attacker.at_war.difference_update(conflict.defenders)
+        for defender in self._resolve_countries(conflict.defenders):
+            defender.at_war.difference_update(conflict.attackers)
 
         self.active_conflicts.remove(conflict)
+        duplicate = next((c for c in self.active_conflicts if c.id == conflict_id), None)
+        if duplicate is not None:
+            self.conflict_index[conflict_id] = duplicate
         logger.info(f"Conflict ended: {conflict_id}")
 
 
+_WORLD_DATA_FILES = (
+    "countries.json",
+    "countries_tier4.json",
+    "countries_tier5.json",
+    "countries_tier6.json",
+    "influence_zones.json",
+)
+
+
+def _read_data_files(data_dir: Path, names: Sequence[str]) -> Dict[str, Optional[bytes]]:
+    """Read data files concurrently (file reads release the GIL); None if missing"""
+    def read(name: str) -> Optional[bytes]:
+        path = data_dir / name
+        return path.read_bytes() if path.exists() else None
+
+    with ThreadPoolExecutor(max_workers=len(names)) as executor:
+        return dict(zip(names, executor.map(read, names)))
+
+
 def load_world_from_json(data_dir: Path, seed: int = 42) -> World:
     """Load world from JSON data files"""
     world = World(seed=seed)
 
+    # Read every file up front, then validate in order on this thread
+    raw = _read_data_files(data_dir, _WORLD_DATA_FILES)
+
     # Load countries (Tier 1-3)
-    countries_file = data_dir / "countries.json"
-    if countries_file.exists():
-        with open(countries_file, "r", encoding="utf-8") as f:
-            countries_data = json.load(f)
-            for country_data in countries_data:
-                country = Country(**country_data)
-                world.countries[country.id] = country
+    if raw["countries.json"] is not None:
+        for country in _COUNTRY_LIST_ADAPTER.validate_json(raw["countries.json"]):
+            world._register_country(country)
         logger.info(f"Loaded {len(world.countries)} countries (Tier 1-3)")
 
     # Load Tier 4 countries
-    tier4_file = data_dir / "countries_tier4.json"
-    if tier4_file.exists():
-        with open(tier4_file, "r", encoding="utf-8") as f:
-            tier4_data = json.load(f)
-            countries_list = tier4_data.get("countries", [])
-            for country_data in countries_list:
-                country = Tier4Country(**country_data)
-                world.tier4_countries[country.id] = country
+    if raw["countries_tier4.json"] is not None:
+        tier4_data = _TIER4_FILE_ADAPTER.validate_json(raw["countries_tier4.json"])
+        for country in tier4_data.get("countries", []):
+            world._register_country(country)
         logger.info(f"Loaded {len(world.tier4_countries)} Tier 4 countries")
 
     # Load Tier 5 countries
-    tier5_file = data_dir / "countries_tier5.json"
-    if tier5_file.exists():
-        with open(tier5_file, "r", encoding="utf-8") as f:
-            tier5_data = json.load(f)
-            countries_list = tier5_data.get("countries", [])
-            for country_data in countries_list:
-                country = Tier5Country(**country_data)
-                world.tier5_countries[country.id] = country
+    if raw["countries_tier5.json"] is not None:
+        tier5_data = _TIER5_FILE_ADAPTER.validate_json(raw["countries_tier5.json"])
+        for country in tier5_data.get("countries", []):
+            world._register_country(country)
         logger.info(f"Loaded {len(world.tier5_countries)} Tier 5 countries")
 
     # Load Tier 6 countries
-    tier6_file = data_dir / "countries_tier6.json"
-    if tier6_file.exists():
-        with open(tier6_file, "r", encoding="utf-8") as f:
-            tier6_data = json.load(f)
-            countries_list = tier6_data.get("countries", [])
-            for country_data in countries_list:
-                country = Tier6Country(**country_data)
-                world.tier6_countries[country.id] = country
+    if raw["countries_tier6.json"] is not None:
+        tier6_data = _TIER6_FILE_ADAPTER.validate_json(raw["countries_tier6.json"])
+        for country in tier6_data.get("countries", []):
+            world._register_country(country)
         logger.info(f"Loaded {len(world.tier6_countries)} Tier 6 countries")
 
     # Load influence zones
-    zones_file = data_dir / "influence_zones.json"
-    if zones_file.exists():
-        with open(zones_file, "r", encoding="utf-8") as f:
-            zones_data = json.load(f)
-            for zone_data in zones_data:
-                zone = InfluenceZone(**zone_data)
-                world.influence_zones[zone.id] = zone
+    if raw["influence_zones.json"] is not None:
+        for zone in _ZONE_LIST_ADAPTER.validate_json(raw["influence_zones.json"]):
+            world.influence_zones[zone.id] = zone
         logger.info(f"Loaded {len(world.influence_zones)} influence zones")
 
     # Initialize relations between countries
@@ -578,67 +748,61 @@ def load_world_from_json(data_dir: Path, seed: int = 42) -> World:
 
 
 def _init_relations(world: World) -> None:
-    """Initialize diplomatic relations based on blocs and rivalries"""
+    """
+    Initialize diplomatic relations based on blocs and rivalries.
+
+    Neutral pairs are not stored: a missing entry reads as 0 through
+    get_relation(), so countries without blocs or rivals are skipped.
+    Bloc partners come from the bloc index rather than a scan of every
+    other country, so the cost follows bloc sizes instead of N².
+    """
     for country in world.countries.values():
-        for other in world.countries.values():
-            if country.id == other.id:
-                continue
+        if not country.blocs and not country.rivals:
+            continue
+
+        # Same bloc = positive relations (dict keeps a stable order)
+        partners = dict.fromkeys(
+            member.id
+            for bloc in country.blocs
+            for member in world.get_bloc_members(bloc)
+        )
+        partners.pop(country.id, None)
+        for other_id in partners:
+            country.relations[other_id] = 30
+
+        # Rivals = negative relations, unless they share a bloc
+        for rival_id in country.rivals:
+            if rival_id in world.countries and rival_id != country.id and rival_id not in partners:
+                country.relations[rival_id] = -50
 
-            # Same bloc = positive relations
-            if country.shares_bloc(other):
-                base_relation = 30
-            # Rivals = negative relations
-            elif other.id in country.rivals:
-                base_relation = -50
-            else:
-                base_relation = 0
 
-            country.relations[other.id] = base_relation
+# Tier 4 starting relations with each major power, indexed by alignment
+# band: pro-West (< -30), neutral, pro-East (> 30). China invests everywhere.
+_TIER4_POWER_RELATIONS: Mapping[str, tuple] = MappingProxyType({
+    "USA": (30, 0, -20),
+    "CHN": (-15, 10, 35),
+    "RUS": (-25, 0, 30),
+    "FRA": (25, 5, -10),
+    "DEU": (25, 5, -10),
+    "GBR": (30, 0, -20),
+})
 
 
 def _init_tier4_relations(world: World) -> None:
     """Initialize Tier 4 countries relations with major powers"""
-    major_powers = ["USA", "CHN", "RUS", "FRA", "DEU", "GBR"]
+    powers = [
+        (power_id, values)
+        for power_id, values in _TIER4_POWER_RELATIONS.items()
+        if power_id in world.countries
+    ]
 
     for country in world.tier4_countries.values():
-        # Set relations based on alignment
-        for power_id in major_powers:
-            if power_id not in world.countries:
-                continue
-
-            # West-aligned powers
-            if power_id in ("USA", "GBR"):
-                # Pro-West countries have good relations with USA/UK
-                if country.alignment < -30:
-                    country.relations[power_id] = 30
-                elif country.alignment > 30:
-                    country.relations[power_id] = -20
-                else:
-                    country.relations[power_id] = 0
-
-            # EU powers
-            elif power_id in ("FRA", "DEU"):
-                if country.alignment < -30:
-                    country.relations[power_id] = 25
-                elif country.alignment > 30:
-                    country.relations[power_id] = -10
-                else:
-                    country.relations[power_id] = 5
-
-            # China
-            elif power_id == "CHN":
-                if country.alignment > 30:
-                    country.relations[power_id] = 35
-                elif country.alignment < -30:
-                    country.relations[power_id] = -15
-                else:
-                    country.relations[power_id] = 10  # China invests everywhere
-
-            # Russia
-            elif power_id == "RUS":
-                if country.alignment > 30:
-                    country.relations[power_id] = 30
-                elif country.alignment < -30:
-                    country.relations[power_id] = -25
-                else:
-                    country.relations[power_id] = 0
+        # Set relations based on alignment band
+        if country.alignment < -30:
+            band = 0
+        elif country.alignment > 30:
+            band = 2
+        else:
+            band = 1
+        for power_id, values in powers:
+            country.relations[power_id] = values[band]
@@ -1,10 +1,14 @@
 """Unified world state for Historia Lite - Phase 12 Architecture"""
-import json
 import logging
+import warnings
+from collections import deque
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+from pydantic_core import from_json
 
 from .base_country import BaseCountry, Personality
 from .tier_manager import TierManager
@@ -26,6 +30,30 @@ class Conflict(BaseModel):
     nuclear_risk: int = Field(default=0, ge=0, le=100)
 
 
+_ZONE_LIST_ADAPTER = TypeAdapter(List[InfluenceZone])
+
+# Only the tail of the event history is ever read; older events are dropped.
+# All tiers report events here, so the bound is wider than the legacy World's.
+MAX_EVENTS_HISTORY = 5000
+
+# Every value BaseCountry.process_frequency may take (ge=1, le=10)
+PROCESS_FREQUENCIES = range(1, 11)
+
+
+def _warn_deprecated(name: str, replacement: str) -> None:
+    """Flag a call to one of the pre-unification tier getters"""
+    warnings.warn(
+        f"UnifiedWorld.{name} is deprecated, use {replacement} instead",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+
+def _empty_attribute_index() -> Dict[str, Dict[Any, Dict[str, BaseCountry]]]:
+    """One empty reverse index per indexed attribute (see UnifiedWorld._index_country)"""
+    return {"tier": {}, "bloc": {}, "region": {}, "protector": {}, "influence_zone": {}}
+
+
 class UnifiedWorld(BaseModel):
     """
     Unified world state using BaseCountry for all countries.
@@ -45,7 +73,9 @@ class UnifiedWorld(BaseModel):
 
     # Conflicts and events
     active_conflicts: List[Conflict] = Field(default_factory=list)
-    events_history: List[Event] = Field(default_factory=list)
+    events_history: Deque[Event] = Field(
+        default_factory=lambda: deque(maxlen=MAX_EVENTS_HISTORY)
+    )
 
     # Active projects by country_id
     active_projects: Dict[str, List] = Field(default_factory=dict)
@@ -75,6 +105,100 @@ class UnifiedWorld(BaseModel):
     # Player tracking
     player_country_id: Optional[str] = None
 
+    # Reverse indexes: attribute name -> value -> {country id: country}, in
+    # countries order. Rebuilt in model_post_init, kept up to date by
+    # _register_country and process_tier_changes. Code that writes an indexed
+    # attribute directly (scenario start sets tier) must call
+    # refresh_indexes(). Excluded fields rather than PrivateAttr because
+    # private attribute reads go through BaseModel.__getattr__ (see World).
+    # Alignment and nuclear status change freely during play and are not
+    # indexed.
+    attribute_index: Dict[str, Dict[Any, Dict[str, BaseCountry]]] = Field(
+        default_factory=_empty_attribute_index, exclude=True, repr=False
+    )
+    # Tier-partitioned results shared between calls as read-only tuples,
+    # dropped whenever tier membership changes
+    tier_lists: Dict[Any, Tuple[BaseCountry, ...]] = Field(
+        default_factory=dict, exclude=True, repr=False
+    )
+    # Countries that carry a nuclear stat at all (nuclear is not None), in
+    # countries order. Arsenal size changes freely, so get_nuclear_powers
+    # still checks it live, but only over this short list. A country that
+    # gains a nuclear stat later must be reported via mark_nuclear_changed.
+    nuclear_capable: Dict[str, BaseCountry] = Field(
+        default_factory=dict, exclude=True, repr=False
+    )
+    # active_conflicts by id (the oldest on a repeated id); the list stays
+    # the ordered source of truth
+    conflict_index: Dict[str, Conflict] = Field(default_factory=dict, exclude=True, repr=False)
+
+    @field_validator("events_history", mode="after")
+    @classmethod
+    def _bound_events_history(cls, value: Deque[Event]) -> Deque[Event]:
+        """Restore the size bound on histories loaded from saves"""
+        return deque(value, maxlen=MAX_EVENTS_HISTORY)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._rebuild_indexes()
+
+    # --- Indexes ---
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild every reverse index from the countries dict"""
+        for index in self.attribute_index.values():
+            index.clear()
+        self.tier_lists.clear()
+        self.nuclear_capable.clear()
+        for country in self.countries.values():
+            self._index_country(country)
+        self.conflict_index.clear()
+        for conflict in self.active_conflicts:
+            self.conflict_index.setdefault(conflict.id, conflict)
+
+    def refresh_indexes(self) -> None:
+        """Re-file every country after indexed attributes were written directly"""
+        self._rebuild_indexes()
+
+    def _index_keys(self, country: BaseCountry):
+        """(index name, key) pairs a country is filed under"""
+        yield "tier", country.tier
+        for bloc in country.blocs:
+            yield "bloc", bloc
+        yield "region", country.region
+        yield "protector", country.protector
+        yield "influence_zone", country.influence_zone
+
+    def _index_country(self, country: BaseCountry) -> None:
+        """Add one country to the reverse indexes"""
+        index = self.attribute_index
+        for name, key in self._index_keys(country):
+            index[name].setdefault(key, {})[country.id] = country
+        self.tier_lists.clear()
+        if country.nuclear is not None:
+            self.nuclear_capable[country.id] = country
+
+    def _register_country(self, country: BaseCountry) -> None:
+        """Add or replace a country and keep the indexes in sync"""
+        replaced = country.id in self.countries
+        self.countries[country.id] = country
+        if replaced:
+            # Keeps index order identical to the countries dict
+            self._rebuild_indexes()
+        else:
+            self._index_country(country)
+
+    def mark_nuclear_changed(self, country_id: str) -> None:
+        """Re-file a country after its nuclear stat was set or cleared"""
+        country = self.countries.get(country_id)
+        if country is None or country.nuclear is None:
+            self.nuclear_capable.pop(country_id, None)
+        else:
+            self.nuclear_capable[country_id] = country
+
+    def _indexed(self, name: str, key: Any) -> List[BaseCountry]:
+        """Countries filed under key in the named index"""
+        return list(self.attribute_index[name].get(key, {}).values())
+
     # --- Universal getters ---
 
     def get_country(self, country_id: str) -> Optional[BaseCountry]:
@@ -91,39 +215,47 @@ class UnifiedWorld(BaseModel):
 
     # --- Tier-based getters ---
 
-    def get_countries_by_tier(self, tier: int) -> List[BaseCountry]:
+    def get_countries_by_tier(self, tier: int) -> Tuple[BaseCountry, ...]:
         """Get all countries of a specific tier"""
-        return [c for c in self.countries.values() if c.tier == tier]
+        countries = self.tier_lists.get(tier)
+        if countries is None:
+            countries = self.tier_lists[tier] = tuple(self._indexed("tier", tier))
+        return countries
 
-    def get_superpowers(self) -> List[BaseCountry]:
+    def get_superpowers(self) -> Tuple[BaseCountry, ...]:
         """Get tier 1 superpowers"""
         return self.get_countries_by_tier(1)
 
-    def get_major_powers(self) -> List[BaseCountry]:
+    def get_major_powers(self) -> Tuple[BaseCountry, ...]:
         """Get tier 1 and 2 powers"""
-        return [c for c in self.countries.values() if c.tier <= 2]
+        countries = self.tier_lists.get("major")
+        if countries is None:
+            countries = self.tier_lists["major"] = (
+                self.get_countries_by_tier(1) + self.get_countries_by_tier(2)
+            )
+        return countries
 
     def get_nuclear_powers(self) -> List[BaseCountry]:
         """Get all nuclear-armed countries"""
-        return [c for c in self.countries.values() if c.is_nuclear_power()]
+        return [c for c in self.nuclear_capable.values() if c.is_nuclear_power()]
 
     def get_bloc_members(self, bloc: str) -> List[BaseCountry]:
         """Get all countries in a bloc"""
-        return [c for c in self.countries.values() if bloc in c.blocs]
+        return self._indexed("bloc", bloc)
 
     # --- Region/Zone based getters ---
 
     def get_countries_by_region(self, region: str) -> List[BaseCountry]:
         """Get all countries in a specific region"""
-        return [c for c in self.countries.values() if c.region == region]
+        return self._indexed("region", region)
 
     def get_countries_by_influence_zone(self, zone_id: str) -> List[BaseCountry]:
         """Get all countries in a specific influence zone"""
-        return [c for c in self.countries.values() if c.influence_zone == zone_id]
+        return self._indexed("influence_zone", zone_id)
 
     def get_countries_by_protector(self, protector_id: str) -> List[BaseCountry]:
         """Get all countries protected by a specific power"""
-        return [c for c in self.countries.values() if c.protector == protector_id]
+        return self._indexed("protector", protector_id)
 
     # --- Alignment based getters ---
 
@@ -136,29 +268,35 @@ class UnifiedWorld(BaseModel):
 
     def get_tier4_country(self, country_id: str) -> Optional[BaseCountry]:
         """DEPRECATED: Use get_country instead"""
+        _warn_deprecated("get_tier4_country", "get_country")
         country = self.countries.get(country_id)
         return country if country and country.tier == 4 else None
 
-    def get_tier4_countries_list(self) -> List[BaseCountry]:
+    def get_tier4_countries_list(self) -> Tuple[BaseCountry, ...]:
         """DEPRECATED: Use get_countries_by_tier(4) instead"""
+        _warn_deprecated("get_tier4_countries_list", "get_countries_by_tier(4)")
         return self.get_countries_by_tier(4)
 
     def get_tier5_country(self, country_id: str) -> Optional[BaseCountry]:
         """DEPRECATED: Use get_country instead"""
+        _warn_deprecated("get_tier5_country", "get_country")
         country = self.countries.get(country_id)
         return country if country and country.tier == 5 else None
 
-    def get_tier5_countries_list(self) -> List[BaseCountry]:
+    def get_tier5_countries_list(self) -> Tuple[BaseCountry, ...]:
         """DEPRECATED: Use get_countries_by_tier(5) instead"""
+        _warn_deprecated("get_tier5_countries_list", "get_countries_by_tier(5)")
         return self.get_countries_by_tier(5)
 
     def get_tier6_country(self, country_id: str) -> Optional[BaseCountry]:
         """DEPRECATED: Use get_country instead"""
+        _warn_deprecated("get_tier6_country", "get_country")
         country = self.countries.get(country_id)
         return country if country and country.tier == 6 else None
 
-    def get_tier6_countries_list(self) -> List[BaseCountry]:
+    def get_tier6_countries_list(self) -> Tuple[BaseCountry, ...]:
         """DEPRECATED: Use get_countries_by_tier(6) instead"""
+        _warn_deprecated("get_tier6_countries_list", "get_countries_by_tier(6)")
         return self.get_countries_by_tier(6)
 
     # Alias for compatibility
@@ -172,10 +310,16 @@ class UnifiedWorld(BaseModel):
 
     def get_recent_events(self, count: int = 20) -> List[Event]:
         """Get most recent events"""
-        return self.events_history[-count:]
+        history = self.events_history
+        return list(islice(history, max(0, len(history) - count), None))
 
     # --- Conflicts ---
 
+    def _resolve_countries(self, country_ids: List[str]) -> List[BaseCountry]:
+        """Look up countries, skipping unknown ids"""
+        countries = self.countries
+        return [c for c in map(countries.get, country_ids) if c is not None]
+
     def start_conflict(
         self,
         attacker_ids: List[str],
@@ -192,70 +336,70 @@ class UnifiedWorld(BaseModel):
             region=region,
         )
 
-        for attacker_id in attacker_ids:
-            attacker = self.get_country(attacker_id)
-            if attacker:
-                for defender_id in defender_ids:
-                    if defender_id not in attacker.at_war:
-                        attacker.at_war.append(defender_id)
-
-        for defender_id in defender_ids:
-            defender = self.get_country(defender_id)
-            if defender:
-                for attacker_id in attacker_ids:
-                    if attacker_id not in defender.at_war:
-                        defender.at_war.append(attacker_id)
-
-        # Calculate nuclear risk
-        all_combatants = [self.get_country(cid) for cid in attacker_ids + defender_ids]
-        if any(c and c.is_nuclear_power() for c in all_combatants):
+        # Resolve each side once; unknown ids are ignored
+        attackers = self._resolve_countries(attacker_ids)
+        defenders = self._resolve_countries(defender_ids)
+
+        for attacker in attackers:
+            attacker.at_war.update(defender_ids)
+        for defender in defenders:
+            defender.at_war.update(attacker_ids)
+
+        # Calculate nuclear risk, stopping at the first nuclear power
+        if any(c.is_nuclear_power() for c in chain(attackers, defenders)):
             conflict.nuclear_risk = 20
 
         self.active_conflicts.append(conflict)
+        # A repeated matchup in the same year reuses the id; the index keeps
+        # the oldest, which is the one end_conflict ends first
+        self.conflict_index.setdefault(conflict.id, conflict)
         logger.info(f"Conflict started: {conflict.id}")
         return conflict
 
     def end_conflict(self, conflict_id: str) -> None:
         """End a conflict"""
-        conflict = next(
-            (c for c in self.active_conflicts if c.id == conflict_id), None
-        )
+        conflict = self.conflict_index.pop(conflict_id, None)
         if not conflict:
             return
 
-        for attacker_id in conflict.attackers:
-            attacker = self.get_country(attacker_id)
-            if attacker:
-                for defender_id in conflict.defenders:
-                    if defender_id in attacker.at_war:
-                        attacker.at_war.remove(defender_id)
-
-        for defender_id in conflict.defenders:
-            defender = self.get_country(defender_id)
-            if defender:
-                for attacker_id in conflict.attackers:
-                    if attacker_id in defender.at_war:
-                        defender.at_war.remove(attacker_id)
+        for attacker in self._resolve_countries(conflict.attackers):
+            attacker.at_war.difference_update(conflict.defenders)
+        for defender in self._resolve_countries(conflict.defenders):
+            defender.at_war.difference_update(conflict.attackers)
 
         self.active_conflicts.remove(conflict)
+        duplicate = next((c for c in self.active_conflicts if c.id == conflict_id), None)
+        if duplicate is not None:
+            self.conflict_index[conflict_id] = duplicate
         logger.info(f"Conflict ended: {conflict_id}")
 
     # --- Tier Processing ---
 
     def get_countries_to_process(self) -> List[BaseCountry]:
         """Get countries that should be processed this tick based on their frequency"""
-        return [
-            c for c in self.countries.values()
-            if c.should_process_this_tick(self.tick_counter)
-        ]
+        # Resolve which frequencies are due once, not once per country
+        tick = self.tick_counter
+        due = {f for f in PROCESS_FREQUENCIES if tick % f == 0}
+        return [c for c in self.countries.values() if c.process_frequency in due]
 
     def process_tier_changes(self) -> List[dict]:
         """Check and apply tier changes for all countries"""
-        return TierManager.process_tier_changes(self.countries, self.tick_counter)
+        events = TierManager.process_tier_changes(self.countries, self.tick_counter)
+        if events:
+            # Tier changes are rare; re-filing every country keeps each
+            # bucket in countries order, which appending the mover would not
+            tiers = self.attribute_index["tier"]
+            tiers.clear()
+            for country in self.countries.values():
+                tiers.setdefault(country.tier, {})[country.id] = country
+            self.tier_lists.clear()
+        return events
 
     def get_tier_stats(self) -> dict:
         """Get statistics about tier distribution"""
-        return TierManager.get_tier_stats(self.countries)
+        # Bucket sizes of the tier index, same shape as TierManager.get_tier_stats
+        tiers = self.attribute_index["tier"]
+        return {tier: len(tiers.get(tier, ())) for tier in range(1, 7)}
 
 
 def load_unified_world_from_json(data_dir: Path, seed: int = 42) -> UnifiedWorld:
@@ -265,22 +409,24 @@ def load_unified_world_from_json(data_dir: Path, seed: int = 42) -> UnifiedWorld
     # Load unified countries file
     countries_file = data_dir / "countries_all.json"
     if countries_file.exists():
-        with open(countries_file, "r", encoding="utf-8") as f:
-            countries_data = json.load(f)
-            for country_data in countries_data:
-                tier = country_data.get("tier", 4)
-
-                # Create BaseCountry based on tier
-                if tier <= 3:
-                    country = BaseCountry.from_tier1_3_data(country_data)
-                elif tier == 4:
-                    country = BaseCountry.from_tier4_data(country_data)
-                elif tier == 5:
-                    country = BaseCountry.from_tier5_data(country_data)
-                else:
-                    country = BaseCountry.from_tier6_data(country_data)
-
-                world.countries[country.id] = country
+        # pydantic-core's native parser: same dicts as json.load, parsed faster
+        countries_data = from_json(countries_file.read_bytes())
+        for country_data in countries_data:
+            tier = country_data.get("tier", 4)
+
+            # Create BaseCountry based on tier. Kept on the validating
+            # constructor: model_construct() resolves every default_factory
+            # in Python and is several times slower than pydantic-core here.
+            if tier <= 3:
+                country = BaseCountry.from_tier1_3_data(country_data)
+            elif tier == 4:
+                country = BaseCountry.from_tier4_data(country_data)
+            elif tier == 5:
+                country = BaseCountry.from_tier5_data(country_data)
+            else:
+                country = BaseCountry.from_tier6_data(country_data)
+
+            world._register_country(country)
 
         logger.info(f"Loaded {len(world.countries)} countries from countries_all.json")
 
@@ -293,11 +439,8 @@ def load_unified_world_from_json(data_dir: Path, seed: int = 42) -> UnifiedWorld
     # Load influence zones
     zones_file = data_dir / "influence_zones.json"
     if zones_file.exists():
-        with open(zones_file, "r", encoding="utf-8") as f:
-            zones_data = json.load(f)
-            for zone_data in zones_data:
-                zone = InfluenceZone(**zone_data)
-                world.influence_zones[zone.id] = zone
+        for zone in _ZONE_LIST_ADAPTER.validate_json(zones_file.read_bytes()):
+            world.influence_zones[zone.id] = zone
         logger.info(f"Loaded {len(world.influence_zones)} influence zones")
 
     # Initialize relations between major powers
@@ -311,74 +454,63 @@ def load_unified_world_from_json(data_dir: Path, seed: int = 42) -> UnifiedWorld
 
 def _init_major_power_relations(world: UnifiedWorld) -> None:
     """Initialize diplomatic relations between major powers (Tier 1-3)"""
-    major_powers = [c for c in world.countries.values() if c.tier <= 3]
-
-    for country in major_powers:
-        for other in major_powers:
-            if country.id == other.id:
+    # Membership sets built once per country rather than once per pair
+    major_powers = [
+        (c, set(c.blocs), set(c.rivals), set(c.allies))
+        for c in world.countries.values() if c.tier <= 3
+    ]
+
+    for country, blocs, rivals, allies in major_powers:
+        relations = country.relations
+        for other, other_blocs, _, _ in major_powers:
+            if other is country:
                 continue
 
             # Same bloc = positive relations
-            if country.shares_bloc(other):
+            if not blocs.isdisjoint(other_blocs):
                 base_relation = 30
             # Rivals = negative relations
-            elif other.id in country.rivals:
+            elif other.id in rivals:
                 base_relation = -50
             # Allies = very positive
-            elif other.id in country.allies:
+            elif other.id in allies:
                 base_relation = 50
             else:
                 base_relation = 0
 
-            country.relations[other.id] = base_relation
+            relations[other.id] = base_relation
+
+
+# Tier 4-6 starting relations with each major power, indexed by alignment
+# band: pro-West (< -30), neutral, pro-East (> 30). China invests everywhere.
+_ALIGNMENT_POWER_RELATIONS: Mapping[str, tuple] = MappingProxyType({
+    "USA": (30, 0, -20),
+    "CHN": (-15, 10, 35),
+    "RUS": (-25, 0, 30),
+    "FRA": (25, 5, -10),
+    "DEU": (25, 5, -10),
+    "GBR": (30, 0, -20),
+})
 
 
 def _init_alignment_relations(world: UnifiedWorld) -> None:
     """Initialize relations for Tier 4-6 countries based on alignment"""
-    major_power_ids = ["USA", "CHN", "RUS", "FRA", "DEU", "GBR"]
+    powers = [
+        (power_id, values)
+        for power_id, values in _ALIGNMENT_POWER_RELATIONS.items()
+        if power_id in world.countries
+    ]
 
     for country in world.countries.values():
         if country.tier <= 3:
             continue  # Already handled
 
         alignment = country.alignment or 0
-
-        for power_id in major_power_ids:
-            if power_id not in world.countries:
-                continue
-
-            # West-aligned powers (USA, GBR)
-            if power_id in ("USA", "GBR"):
-                if alignment < -30:
-                    country.relations[power_id] = 30
-                elif alignment > 30:
-                    country.relations[power_id] = -20
-                else:
-                    country.relations[power_id] = 0
-
-            # EU powers (FRA, DEU)
-            elif power_id in ("FRA", "DEU"):
-                if alignment < -30:
-                    country.relations[power_id] = 25
-                elif alignment > 30:
-                    country.relations[power_id] = -10
-                else:
-                    country.relations[power_id] = 5
-
-            # China
-            elif power_id == "CHN":
-                if alignment > 30:
-                    country.relations[power_id] = 35
-                elif alignment < -30:
-                    country.relations[power_id] = -15
-                else:
-                    country.relations[power_id] = 10
-
-            # Russia
-            elif power_id == "RUS":
-                if alignment > 30:
-                    country.relations[power_id] = 30
-                elif alignment < -30:
-                    country.relations[power_id] = -25
-                else:
-                    country.relations[power_id] = 0
+        if alignment < -30:
+            band = 0
+        elif alignment > 30:
+            band = 2
+        else:
+            band = 1
+        for power_id, values in powers:
+            country.relations[power_id] = values[band]
@@ -5,6 +5,7 @@ from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -45,6 +46,8 @@ app = FastAPI(
     title="Historia Lite",
     description="Simulateur geopolitique moderne - Version Light",
     version="0.1.0",
+    # /api/state dumps every country; orjson renders it ~6x faster than json
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware - Restrict to allowed origins
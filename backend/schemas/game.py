@@ -5,6 +5,7 @@ from pydantic import BaseModel
 from engine.country import Country, Personality, Tier4Country, Tier5Country, Tier6Country
 from engine.region import InfluenceZone
 from engine.events import Event
+from engine.world import World
 
 
 class PersonalityResponse(BaseModel):
@@ -43,7 +44,13 @@ class CountryResponse(BaseModel):
     power_score: float
 
     @classmethod
-    def from_country(cls, country: Country) -> "CountryResponse":
+    def from_country(cls, country: Country, world: Optional[World] = None) -> "CountryResponse":
+        # Neutral relations are not stored; send them as 0 so clients
+        # still list every country
+        relations = country.relations
+        if world is not None:
+            relations = {oid: 0 for oid in world.countries if oid != country.id}
+            relations.update(country.relations)
         return cls(
             id=country.id,
             name=country.name,
@@ -65,9 +72,9 @@ class CountryResponse(BaseModel):
             ),
             regime=country.regime,
             blocs=country.blocs,
-            relations=country.relations,
+            relations=relations,
             sanctions_on=country.sanctions_on,
-            at_war=country.at_war,
+            at_war=sorted(country.at_war),
             allies=country.allies,
             rivals=country.rivals,
             sphere_of_influence=country.sphere_of_influence,
@@ -0,0 +1,75 @@
+"""Shared test doubles and helpers for the backend test suite"""
+import asyncio
+from dataclasses import dataclass, field
+
+import pytest
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop, installed with uvicorn[standard] off Windows"""
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+@dataclass(slots=True)
+class MockCountry:
+    """Mock country for testing"""
+    id: str
+    name: str = ""
+    name_fr: str = ""
+    tier: int = 2
+    economy: int = 50
+    military: int = 50
+    stability: int = 50
+    nuclear: int = 0
+    technology: int = 50
+    soft_power: int = 50
+    resources: int = 50
+    population: int = 50
+    intelligence: int = 50
+    regime: str = "democracy"
+    blocs: list = field(default_factory=list)
+    at_war: set = field(default_factory=set)
+    sanctions_on: list = field(default_factory=list)
+    allies: list = field(default_factory=list)
+    rivals: list = field(default_factory=list)
+    relations: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.name = self.name or self.id
+        self.name_fr = self.name_fr or self.id
+
+    def get_relation(self, other_id: str) -> int:
+        return self.relations.get(other_id, 0)
+
+    def modify_relation(self, other_id: str, delta: int):
+        pass
+
+
+class MockWorld:
+    """Mock world for testing"""
+    def __init__(self):
+        self.year = 2025
+        self.date_display = "Janvier 2025"
+        self.date_display_en = "January 2025"
+        self.oil_price = 80
+        self.global_tension = 50
+        self.defcon_level = 5
+        self.countries = {}
+
+    def get_country(self, country_id: str):
+        return self.countries.get(country_id)
+
+    def get_all_countries(self):
+        return list(self.countries.values())
+
+    def add_country(self, country):
+        self.countries[country.id] = country
+
+
+def assert_stats(actual: dict, expected: dict, abs_tol: float = 0.01):
+    """Assert the expected stats in one comparison, floats within abs_tol"""
+    assert {key: actual.get(key) for key in expected} == pytest.approx(expected, abs=abs_tol)
@@ -1,6 +1,5 @@
 """Tests for economy system"""
 import pytest
-from unittest.mock import MagicMock
 
 from engine.economy import (
     EconomyManager,
@@ -10,35 +9,7 @@ from engine.economy import (
     NationalDebt,
     ForeignReserves,
 )
-
-
-class MockCountry:
-    """Mock country for testing"""
-    def __init__(self, country_id: str, **kwargs):
-        self.id = country_id
-        self.name = kwargs.get("name", country_id)
-        self.name_fr = kwargs.get("name_fr", country_id)
-        self.economy = kwargs.get("economy", 50)
-        self.stability = kwargs.get("stability", 50)
-
-    def modify_relation(self, other_id: str, delta: int):
-        pass
-
-
-class MockWorld:
-    """Mock world for testing"""
-    def __init__(self):
-        self.year = 2025
-        self.countries = {}
-
-    def get_country(self, country_id: str):
-        return self.countries.get(country_id)
-
-    def get_all_countries(self):
-        return list(self.countries.values())
-
-    def add_country(self, country):
-        self.countries[country.id] = country
+from conftest import MockWorld
 
 
 class TestEconomyManager:
@@ -57,20 +28,26 @@ class TestEconomyManager:
 
     def test_reset(self):
         """Test reset clears state"""
-        self.manager.trade_agreements["test"] = MagicMock()
+        self.manager.trade_agreements["test"] = object()
         self.manager.reset()
         assert self.manager.trade_agreements == {}
 
 
+@pytest.fixture(scope="class")
+def trade_manager():
+    """Agreements shared by the read-only partner and volume tests"""
+    manager = EconomyManager()
+    manager.create_trade_agreement("USA", "CHN", TradeType.STANDARD, 50, 2025)
+    manager.create_trade_agreement("USA", "DEU", TradeType.FREE_TRADE, 70, 2025)
+    manager.create_trade_agreement("CHN", "RUS", TradeType.EMBARGO, 30, 2025)
+    return manager
+
+
 class TestTradeAgreements:
     """Test trade agreement functionality"""
 
     def setup_method(self):
         self.manager = EconomyManager()
-        self.world = MockWorld()
-        self.world.add_country(MockCountry("USA"))
-        self.world.add_country(MockCountry("CHN"))
-        self.world.add_country(MockCountry("DEU"))
 
     def test_create_trade_agreement(self):
         """Test creating a trade agreement"""
@@ -88,32 +65,23 @@ class TestTradeAgreements:
         assert agreement.trade_type == TradeType.STANDARD
         assert agreement.is_active
 
-    def test_get_trade_partners(self):
+    def test_get_trade_partners(self, trade_manager):
         """Test getting trade partners"""
-        self.manager.create_trade_agreement("USA", "CHN", TradeType.STANDARD, 50, 2025)
-        self.manager.create_trade_agreement("USA", "DEU", TradeType.FREE_TRADE, 70, 2025)
-
-        partners = self.manager.get_trade_partners("USA")
+        partners = trade_manager.get_trade_partners("USA")
         assert len(partners) == 2
 
         partner_ids = [p[0] for p in partners]
         assert "CHN" in partner_ids
         assert "DEU" in partner_ids
 
-    def test_get_trade_volume(self):
+    def test_get_trade_volume(self, trade_manager):
         """Test calculating total trade volume"""
-        self.manager.create_trade_agreement("USA", "CHN", TradeType.STANDARD, 50, 2025)
-        self.manager.create_trade_agreement("USA", "DEU", TradeType.FREE_TRADE, 70, 2025)
-
-        volume = self.manager.get_trade_volume("USA")
+        volume = trade_manager.get_trade_volume("USA")
         assert volume == 120
 
-    def test_get_trade_volume_excludes_embargo(self):
+    def test_get_trade_volume_excludes_embargo(self, trade_manager):
         """Test that embargo doesn't count in volume"""
-        self.manager.create_trade_agreement("USA", "CHN", TradeType.STANDARD, 50, 2025)
-        self.manager.create_trade_agreement("USA", "RUS", TradeType.EMBARGO, 0, 2025)
-
-        volume = self.manager.get_trade_volume("USA")
+        volume = trade_manager.get_trade_volume("CHN")
         assert volume == 50
 
     def test_get_trade_balance(self):
@@ -268,38 +236,26 @@ class TestEconomicSummary:
         assert health == "critical"
 
 
+@pytest.fixture(scope="class")
+def agreement():
+    """USA-CHN agreement, only read by the partner tests"""
+    return TradeAgreement(id="test", country_a="USA", country_b="CHN")
+
+
 class TestTradeAgreementModel:
     """Test TradeAgreement model"""
 
-    def test_get_partner_country_a(self):
+    def test_get_partner_country_a(self, agreement):
         """Test getting partner when you are country_a"""
-        agreement = TradeAgreement(
-            id="test",
-            country_a="USA",
-            country_b="CHN",
-        )
-
         partner = agreement.get_partner("USA")
         assert partner == "CHN"
 
-    def test_get_partner_country_b(self):
+    def test_get_partner_country_b(self, agreement):
         """Test getting partner when you are country_b"""
-        agreement = TradeAgreement(
-            id="test",
-            country_a="USA",
-            country_b="CHN",
-        )
-
         partner = agreement.get_partner("CHN")
         assert partner == "USA"
 
-    def test_get_partner_not_in_agreement(self):
+    def test_get_partner_not_in_agreement(self, agreement):
         """Test getting partner when not in agreement"""
-        agreement = TradeAgreement(
-            id="test",
-            country_a="USA",
-            country_b="CHN",
-        )
-
         partner = agreement.get_partner("DEU")
         assert partner is None
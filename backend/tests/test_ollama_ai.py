@@ -1,6 +1,5 @@
 """Tests for Ollama AI system"""
 import pytest
-from unittest.mock import MagicMock, AsyncMock, patch
 
 from ai.ollama_ai import (
     OllamaAI,
@@ -8,46 +7,13 @@ from ai.ollama_ai import (
     RateLimiter,
     CachedDecision,
 )
+from conftest import MockCountry, MockWorld, assert_stats
 
-
-class MockCountry:
-    """Mock country for testing"""
-    def __init__(self, country_id: str, **kwargs):
-        self.id = country_id
-        self.name = kwargs.get("name", country_id)
-        self.name_fr = kwargs.get("name_fr", country_id)
-        self.tier = kwargs.get("tier", 2)
-        self.economy = kwargs.get("economy", 50)
-        self.military = kwargs.get("military", 50)
-        self.stability = kwargs.get("stability", 50)
-        self.nuclear = kwargs.get("nuclear", 0)
-        self.technology = kwargs.get("technology", 50)
-        self.soft_power = kwargs.get("soft_power", 50)
-        self.resources = kwargs.get("resources", 50)
-        self.population = kwargs.get("population", 50)
-        self.regime = kwargs.get("regime", "democracy")
-        self.blocs = kwargs.get("blocs", [])
-        self.at_war = kwargs.get("at_war", [])
-        self.sanctions_on = kwargs.get("sanctions_on", [])
-        self.allies = kwargs.get("allies", [])
-        self.rivals = kwargs.get("rivals", [])
-        self.relations = kwargs.get("relations", {})
-
-    def get_relation(self, other_id: str) -> int:
-        return self.relations.get(other_id, 0)
-
-
-class MockWorld:
-    """Mock world for testing"""
-    def __init__(self):
-        self.year = 2025
-        self.oil_price = 80
-        self.global_tension = 50
-        self.defcon_level = 5
-        self.countries = {}
-
-    def get_country(self, country_id: str):
-        return self.countries.get(country_id)
+# Raw model outputs for the _parse_response cases
+VALID_RESPONSE = '{"action": "ECONOMIE", "cible": null, "raison": "test"}'
+SURROUNDED_RESPONSE = 'Voici ma decision: {"action": "MILITAIRE", "cible": null, "raison": "renforcement"} Merci.'
+INVALID_ACTION_RESPONSE = '{"action": "INVALID", "cible": null}'
+NO_JSON_RESPONSE = "Je pense que nous devrions developper l'economie."
 
 
 class TestDecisionCache:
@@ -67,7 +33,7 @@ class TestDecisionCache:
     def test_hash_situation(self):
         """Test situation hashing"""
         hash1 = self.cache._hash_situation(self.country, self.world)
-        assert isinstance(hash1, str)
+        assert hash1 == "5_5_5_0_0_2_5"
 
         # Same situation should give same hash
         hash2 = self.cache._hash_situation(self.country, self.world)
@@ -112,15 +78,16 @@ class TestDecisionCache:
         result = self.cache.get(self.country, self.world)
         assert result is None
 
-    def test_cache_max_size(self):
+    @pytest.mark.parametrize("max_size,inserts", [(3, 5), (1, 10)])
+    def test_cache_max_size(self, max_size, inserts):
         """Test cache evicts oldest when at capacity"""
-        cache = DecisionCache(max_size=3, ttl_ticks=100)
+        cache = DecisionCache(max_size=max_size, ttl_ticks=100)
 
-        for i in range(5):
-            country = MockCountry(f"C{i}")
-            cache.set(country, self.world, {"action": f"A{i}"})
+        for i in range(inserts):
+            cache.set(MockCountry(f"C{i}"), self.world, {"action": f"A{i}"})
 
-        assert len(cache.cache) == 3
+        kept = [entry.decision["action"] for entry in cache.cache.values()]
+        assert kept == [f"A{i}" for i in range(inserts - max_size, inserts)]
 
     def test_get_stats(self):
         """Test getting cache statistics"""
@@ -131,10 +98,7 @@ class TestDecisionCache:
 
         stats = self.cache.get_stats()
 
-        assert stats["size"] == 1
-        assert stats["hits"] == 1
-        assert stats["misses"] == 1
-        assert stats["hit_rate"] == 0.5
+        assert_stats(stats, {"size": 1, "hits": 1, "misses": 1, "hit_rate": 0.5})
 
     def test_clear(self):
         """Test clearing the cache"""
@@ -149,71 +113,103 @@ class TestDecisionCache:
         assert self.cache.misses == 0
 
 
+class FakeClock:
+    """Stands in for time and asyncio inside ai.ollama_ai"""
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+        self.sleeps = []
+
+    def time(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
 class TestRateLimiter:
     """Test RateLimiter class"""
 
+    @pytest.fixture(autouse=True)
+    def fake_clock(self, monkeypatch):
+        self.clock = FakeClock()
+        monkeypatch.setattr("ai.ollama_ai.time", self.clock)
+        monkeypatch.setattr("ai.ollama_ai.asyncio", self.clock)
+
     def setup_method(self):
         self.limiter = RateLimiter(min_interval=0.1)
 
     @pytest.mark.asyncio
     async def test_first_request_no_wait(self):
         """Test first request doesn't wait"""
-        import time
-        start = time.time()
         await self.limiter.wait("test")
-        elapsed = time.time() - start
 
-        assert elapsed < 0.05  # Should be nearly instant
+        assert self.clock.sleeps == []
 
     @pytest.mark.asyncio
     async def test_rapid_requests_throttled(self):
         """Test rapid requests are throttled"""
-        import time
+        await self.limiter.wait("test")
+        start = self.clock.now
+        await self.limiter.wait("test")
+
+        # Should have waited the full 0.1 seconds
+        assert self.clock.sleeps == [pytest.approx(0.1)]
+        assert self.clock.now - start == pytest.approx(0.1)
 
+    @pytest.mark.asyncio
+    async def test_request_after_interval_no_wait(self):
+        """Test a request after the interval has passed doesn't wait"""
         await self.limiter.wait("test")
-        start = time.time()
+        self.clock.now += 0.2
         await self.limiter.wait("test")
-        elapsed = time.time() - start
 
-        # Should have waited ~0.1 seconds
-        assert elapsed >= 0.09
+        assert self.clock.sleeps == []
 
     @pytest.mark.asyncio
     async def test_different_keys_independent(self):
         """Test different keys are independent"""
-        import time
-
         await self.limiter.wait("key1")
-        start = time.time()
         await self.limiter.wait("key2")  # Different key
-        elapsed = time.time() - start
 
-        assert elapsed < 0.05  # Should be nearly instant
+        assert self.clock.sleeps == []
+
+
+def _make_ai() -> OllamaAI:
+    """AI pointed at a local test model"""
+    return OllamaAI(base_url="http://localhost:11434", model="test-model")
+
+
+@pytest.fixture(scope="class")
+def shared_ai():
+    """One AI for the tests that only call its stateless helpers"""
+    return _make_ai()
 
 
 class TestOllamaAI:
     """Test OllamaAI class"""
 
     def setup_method(self):
-        self.ai = OllamaAI(
-            base_url="http://localhost:11434",
-            model="test-model",
-        )
         self.country = MockCountry("USA", rivals=["RUS"])
         self.world = MockWorld()
 
-    def test_init(self):
+    @pytest.fixture
+    def ai(self):
+        """Fresh AI for tests that touch counters or the cache"""
+        return _make_ai()
+
+    def test_init(self, ai):
         """Test AI initialization"""
-        assert self.ai.base_url == "http://localhost:11434"
-        assert self.ai.model == "test-model"
-        assert self.ai.fallback_count == 0
-        assert self.ai.success_count == 0
-        assert isinstance(self.ai.cache, DecisionCache)
-        assert isinstance(self.ai.rate_limiter, RateLimiter)
-
-    def test_build_prompt(self):
+        assert ai.base_url == "http://localhost:11434"
+        assert ai.model == "test-model"
+        assert ai.fallback_count == 0
+        assert ai.success_count == 0
+        assert type(ai.cache) is DecisionCache
+        assert type(ai.rate_limiter) is RateLimiter
+
+    def test_build_prompt(self, shared_ai):
         """Test prompt building"""
-        prompt = self.ai._build_prompt(self.country, self.world)
+        prompt = shared_ai._build_prompt(self.country, self.world)
 
         assert "USA" in prompt
         assert "2025" in prompt
@@ -221,95 +217,58 @@ class TestOllamaAI:
         assert "ECONOMIE" in prompt  # Actions
         assert "JSON" in prompt
 
-    def test_parse_response_valid(self):
-        """Test parsing valid JSON response"""
-        response = '{"action": "ECONOMIE", "cible": null, "raison": "test"}'
-
-        result = self.ai._parse_response(response, self.country, self.world)
-
-        assert result is not None
-        assert result["action"] == "ECONOMIE"
-        assert result["reason"] == "test"
-
-    def test_parse_response_with_text(self):
-        """Test parsing response with surrounding text"""
-        response = 'Voici ma decision: {"action": "MILITAIRE", "cible": null, "raison": "renforcement"} Merci.'
-
-        result = self.ai._parse_response(response, self.country, self.world)
-
-        assert result is not None
-        assert result["action"] == "MILITAIRE"
-
-    def test_parse_response_invalid_action(self):
-        """Test parsing response with invalid action"""
-        response = '{"action": "INVALID", "cible": null}'
-
-        result = self.ai._parse_response(response, self.country, self.world)
-
-        assert result is None
-
-    def test_parse_response_no_json(self):
-        """Test parsing response without JSON"""
-        response = "Je pense que nous devrions developper l'economie."
-
-        result = self.ai._parse_response(response, self.country, self.world)
-
-        assert result is None
-
-    def test_algorithmic_fallback_at_war(self):
-        """Test fallback prioritizes military when at war"""
-        country = MockCountry("USA", at_war=["IRQ"])
-
-        result = self.ai._algorithmic_fallback(country, self.world)
-
-        assert result["action"] == "MILITAIRE"
+    @pytest.mark.parametrize("response,expected", [
+        (VALID_RESPONSE, {"action": "ECONOMIE", "reason": "test"}),
+        (SURROUNDED_RESPONSE, {"action": "MILITAIRE"}),
+        (INVALID_ACTION_RESPONSE, None),
+        (NO_JSON_RESPONSE, None),
+    ])
+    def test_parse_response(self, shared_ai, response, expected):
+        """Test parsing JSON responses, bare or wrapped in text"""
+        result = shared_ai._parse_response(response, self.country, self.world)
+
+        if expected is None:
+            assert result is None
+        else:
+            assert result is not None
+            for key, value in expected.items():
+                assert result[key] == value
+
+    @pytest.mark.parametrize("country_id,kwargs,expected", [
+        # Military first when at war
+        ("USA", {"at_war": {"IRQ"}}, "MILITAIRE"),
+        # Stability first when low
+        ("VEN", {"stability": 30}, "STABILITE"),
+        # Economy first when low
+        ("ARG", {"stability": 60, "economy": 40}, "ECONOMIE"),
+        # Stable, rich, not tier 1-2: expand influence
+        ("CHE", {"tier": 3, "stability": 80, "economy": 70, "technology": 70}, "INFLUENCE"),
+    ])
+    def test_algorithmic_fallback(self, shared_ai, country_id, kwargs, expected):
+        """Test fallback picks the action the situation calls for"""
+        country = MockCountry(country_id, **kwargs)
+
+        result = shared_ai._algorithmic_fallback(country, self.world)
+
+        assert result["action"] == expected
         assert result["is_fallback"] is True
 
-    def test_algorithmic_fallback_low_stability(self):
-        """Test fallback prioritizes stability when low"""
-        country = MockCountry("VEN", stability=30)
-
-        result = self.ai._algorithmic_fallback(country, self.world)
-
-        assert result["action"] == "STABILITE"
-
-    def test_algorithmic_fallback_low_economy(self):
-        """Test fallback prioritizes economy when low"""
-        country = MockCountry("ARG", stability=60, economy=40)
-
-        result = self.ai._algorithmic_fallback(country, self.world)
-
-        assert result["action"] == "ECONOMIE"
-
-    def test_algorithmic_fallback_default(self):
-        """Test fallback picks appropriate action based on situation"""
-        # Tier 3 country with high stats - should pick influence
-        country = MockCountry("CHE", tier=3, stability=80, economy=70, technology=70)
-
-        result = self.ai._algorithmic_fallback(country, self.world)
-
-        # Should pick influence expansion since stable, rich, and not tier 1-2
-        assert result["action"] == "INFLUENCE"
-        assert result["is_fallback"] is True
-
-    def test_get_stats(self):
+    def test_get_stats(self, ai):
         """Test getting AI statistics"""
-        self.ai.success_count = 10
-        self.ai.fallback_count = 2
+        ai.success_count = 10
+        ai.fallback_count = 2
 
-        stats = self.ai.get_stats()
+        stats = ai.get_stats()
 
-        assert stats["success_count"] == 10
-        assert stats["fallback_count"] == 2
-        assert abs(stats["success_rate"] - 0.833) < 0.01
+        assert_stats(stats, {"success_count": 10, "fallback_count": 2, "success_rate": 0.833})
         assert "cache_stats" in stats
 
     @pytest.mark.asyncio
-    async def test_make_decision_uses_cache(self):
+    async def test_make_decision_uses_cache(self, ai):
         """Test make_decision returns cached decision"""
         cached_decision = {"action": "TECHNOLOGIE", "target": None, "reason": "cached"}
-        self.ai.cache.set(self.country, self.world, cached_decision)
+        ai.cache.set(self.country, self.world, cached_decision)
 
-        result = await self.ai.make_decision(self.country, self.world)
+        result = await ai.make_decision(self.country, self.world)
 
         assert result == cached_decision
@@ -0,0 +1,67 @@
+"""Tests for the API response schemas"""
+from pathlib import Path
+
+from engine.events import Event
+from engine.world import load_world_from_json
+from schemas.game import (
+    CountryResponse,
+    EventResponse,
+    InfluenceZoneResponse,
+    PersonalityResponse,
+    Tier4CountryResponse,
+    Tier5CountryResponse,
+    Tier6CountryResponse,
+)
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+def _assert_schema_types(response) -> None:
+    """Dumped fields must pass strict validation against the schema"""
+    type(response).model_validate(response.model_dump(), strict=True)
+    if "power_score" in type(response).model_fields:
+        assert type(response.power_score) is float
+
+
+class TestResponseFactories:
+    """Test the from_* factories build correctly typed responses"""
+
+    def setup_method(self):
+        self.world = load_world_from_json(DATA_DIR)
+
+    def test_country_response(self):
+        """Test CountryResponse fields keep their declared types"""
+        country = self.world.countries["USA"]
+        country.at_war.update({"RUS", "CHN"})
+        response = CountryResponse.from_country(country)
+
+        _assert_schema_types(response)
+        assert type(response.personality) is PersonalityResponse
+        assert response.at_war == ["CHN", "RUS"]
+
+    def test_country_response_fills_neutral_relations(self):
+        """Test neutral relations are sent as 0 for every other country"""
+        country = self.world.countries["BRA"]
+        response = CountryResponse.from_country(country, self.world)
+
+        assert set(response.relations) == set(self.world.countries) - {"BRA"}
+        assert all(response.relations[k] == v for k, v in country.relations.items())
+
+    def test_tier_country_responses(self):
+        """Test Tier 4-6 responses keep their declared types"""
+        for country in self.world.tier4_countries.values():
+            _assert_schema_types(Tier4CountryResponse.from_tier4_country(country))
+        for country in self.world.tier5_countries.values():
+            _assert_schema_types(Tier5CountryResponse.from_tier5_country(country))
+        for country in self.world.tier6_countries.values():
+            _assert_schema_types(Tier6CountryResponse.from_tier6_country(country))
+
+    def test_zone_and_event_responses(self):
+        """Test zone and event responses keep their declared types"""
+        for zone in self.world.influence_zones.values():
+            _assert_schema_types(InfluenceZoneResponse.from_zone(zone))
+        event = Event(
+            id="evt_1", year=2025, type="test", title="Test", title_fr="Test",
+            description="Test", description_fr="Test",
+        )
+        _assert_schema_types(EventResponse.from_event(event))
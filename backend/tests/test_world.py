@@ -0,0 +1,408 @@
+"""Tests for world state (GameDate, World)"""
+from pathlib import Path
+
+import pytest
+
+from api.game_state import get_tier_country
+from engine.country import Country, Tier4Country, Tier5Country, Tier6Country
+from engine.events import Event
+from engine.scenario import ScenarioManager
+from engine.world import (
+    MAX_EVENTS_HISTORY, GameDate, GeopoliticalEra, World, WorldMood,
+    _init_relations, _init_tier4_relations, load_world_from_json,
+)
+from engine.tick import _update_relations, _update_relations_monthly
+from engine.timeline import TimelineEvent
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+class TestGameDate:
+    """Test GameDate class"""
+
+    def test_ordering_within_month_boundary(self):
+        """Test March 31 sorts before April 1"""
+        assert GameDate(year=2025, month=3, day=31) < GameDate(year=2025, month=4, day=1)
+        assert GameDate(year=2025, month=4, day=1) > GameDate(year=2025, month=3, day=31)
+
+    def test_ordering_same_month(self):
+        """Test day breaks ties within a month"""
+        early = GameDate(year=2025, month=6, day=1)
+        late = GameDate(year=2025, month=6, day=15)
+        assert early < late
+        assert early <= late
+        assert late >= early
+        assert not early > late
+
+    def test_equality_and_hash(self):
+        """Test equal dates compare and hash equal"""
+        a = GameDate(year=2025, month=2, day=10)
+        b = GameDate(year=2025, month=2, day=10)
+        assert a == b
+        assert hash(a) == hash(b)
+        assert a != GameDate(year=2025, month=2, day=11)
+        assert a != "2025-02-10"
+        with pytest.raises(TypeError):
+            a < "2025-02-10"
+
+    def test_ordinal_is_day_exact(self):
+        """Test the sort key separates month ends from month starts"""
+        march_end = GameDate(year=2025, month=3, day=31)
+        april_start = GameDate(year=2025, month=4, day=1)
+        assert march_end.to_ordinal() < april_start.to_ordinal()
+
+    def test_add_months_wraps_year(self):
+        """Test adding months across a year boundary"""
+        date = GameDate(year=2025, month=11, day=5).add_months(3)
+        assert (date.year, date.month, date.day) == (2026, 2, 5)
+
+    def test_add_months_batch_matches_add_months(self):
+        """Test batch scheduling agrees with add_months for each offset"""
+        base = GameDate(year=2025, month=11, day=7)
+        offsets = [0, 1, 2, 14, -11, -23]
+        assert base.add_months_batch(offsets) == [base.add_months(n) for n in offsets]
+        assert base.add_months_batch([]) == []
+
+    def test_subtract_months_wraps_year(self):
+        """Test subtracting months across a year boundary"""
+        date = GameDate(year=2025, month=2).subtract_months(3)
+        assert (date.year, date.month) == (2024, 11)
+
+    def test_months_between_and_since(self):
+        """Test month differences"""
+        start = GameDate(year=2025, month=1)
+        end = GameDate(year=2026, month=3)
+        assert end.months_since(start) == 14
+        assert start.months_since(end) == -14
+        assert start.months_between(end) == 14
+
+    def test_pydantic_round_trip(self):
+        """Test GameDate fields validate from dicts and dump back to dicts"""
+        event = TimelineEvent(
+            id="evt_1",
+            date={"year": 2025, "month": 4, "day": 2},
+            actor_country="USA",
+            title="Test",
+            title_fr="Test",
+            description="Test",
+            description_fr="Test",
+        )
+        assert isinstance(event.date, GameDate)
+        assert event.date == GameDate(year=2025, month=4, day=2)
+
+        dumped = event.model_dump()
+        assert dumped["date"] == {"year": 2025, "month": 4, "day": 2}
+
+        restored = TimelineEvent.model_validate_json(event.model_dump_json())
+        assert restored.date == event.date
+
+    def test_pydantic_rejects_invalid(self):
+        """Test invalid date payloads are rejected"""
+        with pytest.raises(ValueError):
+            TimelineEvent(
+                id="evt_1",
+                date={"month": 4},
+                actor_country="USA",
+                title="Test",
+                title_fr="Test",
+                type="diplomatic",
+            )
+
+
+class TestWorldMood:
+    """Test WorldMood class"""
+
+    def test_to_dict(self):
+        """Test to_dict reflects the current fields and era"""
+        mood = WorldMood()
+        mood.war_fatigue = 40
+        mood.current_era = GeopoliticalEra.DETENTE
+        data = mood.to_dict()
+        assert data["war_fatigue"] == 40
+        assert data["current_era"] == "detente"
+        assert data["era_display_fr"] == mood.get_era_display("fr")
+        assert data["era_display_en"] == mood.get_era_display("en")
+        assert data["era_effects"]["war_cost_modifier"] == 1.5
+
+        data["era_effects"]["war_cost_modifier"] = 0
+        assert mood.to_dict()["era_effects"]["war_cost_modifier"] == 1.5
+
+
+def _make_world() -> World:
+    """Small world with one country per tier and a duplicated id"""
+    world = World()
+    world._register_country(Country(id="USA", name="USA", name_fr="USA", tier=1, blocs=["NATO"]))
+    world._register_country(Country(id="SYR", name="Syria", name_fr="Syrie", tier=3))
+    world._register_country(Tier4Country(id="SYR", name="Syria", name_fr="Syrie", region="middle_east"))
+    world._register_country(Tier4Country(id="KEN", name="Kenya", name_fr="Kenya", region="africa"))
+    world._register_country(Tier5Country(
+        id="BWA", name="Botswana", name_fr="Botswana", region="africa",
+        protector="GBR", influence_zone="southern_africa",
+    ))
+    world._register_country(Tier6Country(
+        id="MCO", name="Monaco", name_fr="Monaco", region="europe",
+        protector="FRA", influence_zone="western_europe",
+    ))
+    return world
+
+
+class TestWorld:
+    """Test World class"""
+
+    def test_register_country_routes_by_tier(self):
+        """Test registered countries land in their tier dict"""
+        world = _make_world()
+        assert set(world.countries) == {"USA", "SYR"}
+        assert set(world.tier4_countries) == {"SYR", "KEN"}
+        assert set(world.tier5_countries) == {"BWA"}
+        assert set(world.tier6_countries) == {"MCO"}
+
+    def test_get_any_country(self):
+        """Test lookup across tiers, Tier 1-3 winning on duplicate ids"""
+        world = _make_world()
+        assert world.get_any_country("MCO").tier == 6
+        assert world.get_any_country("KEN").tier == 4
+        assert world.get_any_country("SYR").tier == 3
+        assert world.get_any_country("ZZZ") is None
+
+    def test_index_rebuilt_from_saved_state(self):
+        """Test a world rebuilt from model_dump() has a usable index"""
+        world = _make_world()
+        dumped = world.model_dump()
+        assert "country_index" not in dumped
+
+        restored = World(**dumped)
+        assert restored.get_all_countries_count() == world.get_all_countries_count()
+        assert restored.get_any_country("BWA") is restored.tier5_countries["BWA"]
+        assert restored.get_any_country("SYR").tier == 3
+
+    def test_date_labels_follow_calendar(self):
+        """Test date display and elapsed months refresh when the date changes"""
+        world = World(year=2025, month=12)
+        assert world.date_display == "Décembre 2025"
+        assert world.total_months_elapsed == 11
+
+        world.advance_month()
+        assert world.date_display == "Janvier 2026"
+        assert world.date_display_en == "January 2026"
+        assert world.total_months_elapsed == 12
+
+        world.year = 2030  # e.g. a scenario start
+        assert world.date_display_en == "January 2030"
+
+        world.start_year, world.start_month = 2030, 1
+        assert world.total_months_elapsed == 0
+
+        dumped = world.model_dump()
+        assert "date_cache" not in dumped
+        assert dumped["date_display"] == "Janvier 2030"
+        assert dumped["current_date"] == {"year": 2030, "month": 1, "day": 1}
+        assert World(**dumped).total_months_elapsed == dumped["total_months_elapsed"]
+
+    def test_indexes_not_shared_between_worlds(self):
+        """Test each World gets its own index containers"""
+        world = _make_world()
+        empty = World()
+        assert empty.get_tier4_by_region("africa") == []
+        assert empty.attribute_index is not world.attribute_index
+        assert empty.get_any_country("USA") is None
+
+    def test_attribute_getters(self):
+        """Test region, protector, zone, bloc and tier getters"""
+        world = _make_world()
+        assert [c.id for c in world.get_tier4_by_region("africa")] == ["KEN"]
+        assert [c.id for c in world.get_tier5_by_region("africa")] == ["BWA"]
+        assert world.get_tier6_by_region("africa") == []
+        assert [c.id for c in world.get_tier5_by_protector("GBR")] == ["BWA"]
+        assert [c.id for c in world.get_tier6_by_protector("FRA")] == ["MCO"]
+        assert [c.id for c in world.get_countries_by_influence_zone("western_europe")] == ["MCO"]
+        assert [c.id for c in world.get_bloc_members("NATO")] == ["USA"]
+        assert [c.id for c in world.get_superpowers()] == ["USA"]
+        assert [c.id for c in world.get_major_powers()] == ["USA"]
+
+    def test_register_country_replaces_existing(self):
+        """Test re-registering an id does not leave stale index entries"""
+        world = _make_world()
+        count = world.get_all_countries_count()
+        world._register_country(Tier4Country(id="KEN", name="Kenya", name_fr="Kenya", region="east_africa"))
+        assert world.get_all_countries_count() == count == 6
+        assert world.get_tier4_by_region("africa") == []
+        assert [c.id for c in world.get_tier4_by_region("east_africa")] == ["KEN"]
+
+    def test_get_tier_country_reads_tier_dict(self):
+        """Test the tier routes' lookup finds Tier 4 SYR despite the Tier 3 duplicate"""
+        world = _make_world()
+        assert get_tier_country(world, 4, "SYR") is world.tier4_countries["SYR"]
+        assert get_tier_country(world, 6, "MCO") is world.tier6_countries["MCO"]
+        assert get_tier_country(world, 5, "MCO") is None
+
+    def test_load_world_from_json(self):
+        """Test the shipped data files load into typed models"""
+        world = load_world_from_json(DATA_DIR)
+        assert all(isinstance(c, Tier4Country) for c in world.tier4_countries.values())
+        assert all(isinstance(c, Tier5Country) for c in world.tier5_countries.values())
+        assert all(isinstance(c, Tier6Country) for c in world.tier6_countries.values())
+        assert world.influence_zones
+        assert world.get_all_countries_count() == (
+            len(world.countries) + len(world.tier4_countries)
+            + len(world.tier5_countries) + len(world.tier6_countries)
+        )
+
+    def test_scenario_tier_changes_reach_indexes(self):
+        """Test scenario tier overrides show up in the tier getters"""
+        world = load_world_from_json(DATA_DIR)
+        manager = ScenarioManager()
+        manager.load_scenarios(DATA_DIR)
+        assert manager.start_scenario("multipolar_2040", world, "USA")
+
+        scan = [c.id for c in world.countries.values() if c.tier == 1]
+        assert "IND" in scan
+        assert [c.id for c in world.get_superpowers()] == scan
+        assert world.countries["BRA"] in world.get_major_powers()
+
+    def test_load_world_skips_missing_files(self, tmp_path):
+        """Test a data dir with only some files still loads"""
+        (tmp_path / "countries.json").write_text(
+            '[{"id": "USA", "name": "USA", "name_fr": "USA", "tier": 1}]', encoding="utf-8"
+        )
+        world = load_world_from_json(tmp_path)
+        assert list(world.countries) == ["USA"]
+        assert world.tier4_countries == {}
+        assert world.influence_zones == {}
+
+    def test_init_relations_bloc_and_rivals(self):
+        """Test bloc partners get +30, rivals -50 and bloc beats rivalry"""
+        world = World()
+        world._register_country(Country(
+            id="FRA", name="France", name_fr="France", tier=2,
+            blocs=["NATO", "EU"], rivals=["DEU", "RUS"],
+        ))
+        world._register_country(Country(id="DEU", name="Germany", name_fr="Allemagne", tier=2, blocs=["EU"]))
+        world._register_country(Country(id="RUS", name="Russia", name_fr="Russie", tier=1))
+        world._register_country(Country(id="BRA", name="Brazil", name_fr="Bresil", tier=2))
+        _init_relations(world)
+
+        assert world.countries["FRA"].relations == {"DEU": 30, "RUS": -50}
+        assert world.countries["DEU"].relations == {"FRA": 30}
+        assert world.countries["BRA"].relations == {}
+
+    def test_sanctions_erode_neutral_relations(self):
+        """Test sanctions and rivalries hit pairs with no stored relation"""
+        world = World()
+        world._register_country(Country(
+            id="FRA", name="France", name_fr="France", tier=2,
+            sanctions_on=["BRA"], rivals=["RUS"],
+        ))
+        world._register_country(Country(id="RUS", name="Russia", name_fr="Russie", tier=1))
+        world._register_country(Country(id="BRA", name="Brazil", name_fr="Bresil", tier=2))
+        _update_relations(world)
+        assert world.countries["FRA"].relations == {"RUS": -2, "BRA": -5}
+
+        _update_relations_monthly(world)
+        assert world.countries["FRA"].relations["BRA"] == -7
+
+    def test_init_tier4_relations_by_alignment_band(self):
+        """Test Tier 4 relations follow alignment bands for present powers"""
+        world = World()
+        world._register_country(Country(id="USA", name="USA", name_fr="USA", tier=1))
+        world._register_country(Country(id="CHN", name="China", name_fr="Chine", tier=1))
+        world._register_country(Tier4Country(id="PRW", name="West", name_fr="Ouest", alignment=-50))
+        world._register_country(Tier4Country(id="NEU", name="Neutral", name_fr="Neutre", alignment=30))
+        world._register_country(Tier4Country(id="PRE", name="East", name_fr="Est", alignment=31))
+        _init_tier4_relations(world)
+
+        assert world.tier4_countries["PRW"].relations == {"USA": 30, "CHN": -15}
+        assert world.tier4_countries["NEU"].relations == {"USA": 0, "CHN": 10}
+        assert world.tier4_countries["PRE"].relations == {"USA": -20, "CHN": 35}
+
+
+class TestConflicts:
+    """Test World conflict bookkeeping"""
+
+    def setup_method(self):
+        self.world = World()
+        for cid in ("USA", "RUS", "CHN"):
+            self.world._register_country(Country(id=cid, name=cid, name_fr=cid, tier=1))
+
+    def test_start_and_end_conflict(self):
+        """Test conflicts are indexed by id and removed on end"""
+        conflict = self.world.start_conflict(["USA"], ["RUS"])
+        assert self.world.conflict_index[conflict.id] is conflict
+        assert self.world.active_conflicts == [conflict]
+
+        assert self.world.countries["USA"].at_war == {"RUS"}
+        assert self.world.countries["RUS"].at_war == {"USA"}
+
+        self.world.end_conflict(conflict.id)
+        assert self.world.active_conflicts == []
+        assert conflict.id not in self.world.conflict_index
+        assert self.world.countries["USA"].at_war == set()
+        self.world.end_conflict(conflict.id)  # unknown id is a no-op
+
+    def test_repeated_conflict_ids_end_oldest_first(self):
+        """Test a repeated matchup in the same year shares an id and ends in order"""
+        first = self.world.start_conflict(["USA"], ["RUS"])
+        second = self.world.start_conflict(["USA"], ["RUS"], region="europe")
+        assert first.id == second.id
+
+        self.world.end_conflict(first.id)
+        assert len(self.world.active_conflicts) == 1
+        assert self.world.active_conflicts[0] is second
+        assert self.world.conflict_index[first.id] is second
+
+        self.world.end_conflict(first.id)
+        assert self.world.active_conflicts == []
+        assert self.world.conflict_index == {}
+
+    def test_conflict_index_rebuilt_from_saved_state(self):
+        """Test a reloaded world can end its saved conflicts"""
+        conflict = self.world.start_conflict(["USA"], ["CHN"])
+        restored = World(**self.world.model_dump())
+        restored.end_conflict(conflict.id)
+        assert restored.active_conflicts == []
+
+    def test_at_war_survives_json_round_trip(self):
+        """Test at_war is dumped as a list and reloaded as a set"""
+        self.world.start_conflict(["USA", "CHN"], ["RUS"])
+        restored = World.model_validate_json(self.world.model_dump_json())
+        assert restored.countries["RUS"].at_war == {"USA", "CHN"}
+
+    def test_nuclear_risk_follows_current_arsenal(self):
+        """Test nuclear risk uses arsenals at the time the war starts"""
+        assert self.world.start_conflict(["USA"], ["RUS"]).nuclear_risk == 0
+
+        self.world.countries["RUS"].nuclear = 50
+        assert self.world.start_conflict(["CHN"], ["RUS"]).nuclear_risk == 20
+        assert self.world.start_conflict(["CHN"], ["XXX"]).nuclear_risk == 0
+
+
+def _make_event(n: int) -> Event:
+    return Event(
+        id=f"evt_{n}", year=2025, type="test", title="Test", title_fr="Test",
+        description="Test", description_fr="Test",
+    )
+
+
+class TestEventsHistory:
+    """Test World event history"""
+
+    def test_recent_events_tail(self):
+        """Test get_recent_events returns the newest events in order"""
+        world = World()
+        for n in range(5):
+            world.add_event(_make_event(n))
+        assert [e.id for e in world.get_recent_events(2)] == ["evt_3", "evt_4"]
+        assert len(world.get_recent_events(50)) == 5
+
+    def test_history_is_bounded(self):
+        """Test old events drop off, including after a save reload"""
+        world = World()
+        for n in range(MAX_EVENTS_HISTORY + 10):
+            world.add_event(_make_event(n))
+        assert len(world.events_history) == MAX_EVENTS_HISTORY
+        assert world.events_history[0].id == "evt_10"
+
+        restored = World(**world.model_dump())
+        restored.add_event(_make_event(-1))
+        assert len(restored.events_history) == MAX_EVENTS_HISTORY
+        assert restored.events_history[0].id == "evt_11"
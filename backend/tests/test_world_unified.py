@@ -0,0 +1,293 @@
+"""Tests for the unified world state (UnifiedWorld)"""
+import warnings
+from pathlib import Path
+
+import pytest
+
+from api.game_state import get_tier_country
+
+from engine.base_country import BaseCountry
+from engine.events import Event
+from engine.scenario import ScenarioManager
+from engine.tier_manager import TierManager
+from engine.world_unified import (
+    MAX_EVENTS_HISTORY, UnifiedWorld, load_unified_world_from_json,
+    _init_alignment_relations, _init_major_power_relations,
+)
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+def _make_world() -> UnifiedWorld:
+    """Small world spanning tiers, blocs, regions and protectors"""
+    world = UnifiedWorld()
+    world._register_country(BaseCountry(
+        id="USA", name="USA", name_fr="USA", tier=1, region="north_america",
+        economy=95, stability=80, military=95, nuclear=90, technology=95,
+        blocs=["NATO"],
+    ))
+    world._register_country(BaseCountry(
+        id="FRA", name="France", name_fr="France", tier=2, region="europe", blocs=["NATO", "EU"],
+    ))
+    world._register_country(BaseCountry(id="KEN", name="Kenya", name_fr="Kenya", tier=4, region="africa"))
+    world._register_country(BaseCountry(
+        id="BWA", name="Botswana", name_fr="Botswana", tier=5, region="africa",
+        protector="GBR", influence_zone="southern_africa",
+    ))
+    return world
+
+
+class TestUnifiedWorldIndexes:
+    """Test UnifiedWorld reverse indexes"""
+
+    def test_attribute_getters(self):
+        """Test tier, bloc, region, protector and zone getters"""
+        world = _make_world()
+        assert [c.id for c in world.get_superpowers()] == ["USA"]
+        assert [c.id for c in world.get_major_powers()] == ["USA", "FRA"]
+        assert [c.id for c in world.get_countries_by_tier(4)] == ["KEN"]
+        assert [c.id for c in world.get_bloc_members("NATO")] == ["USA", "FRA"]
+        assert [c.id for c in world.get_bloc_members("EU")] == ["FRA"]
+        assert [c.id for c in world.get_countries_by_region("africa")] == ["KEN", "BWA"]
+        assert [c.id for c in world.get_countries_by_protector("GBR")] == ["BWA"]
+        assert [c.id for c in world.get_countries_by_influence_zone("southern_africa")] == ["BWA"]
+        assert world.get_countries_by_tier(3) == ()
+
+    def test_deprecated_tier_getters_warn_and_forward(self):
+        """Test the old tier getters warn and return the indexed results"""
+        world = _make_world()
+        with pytest.warns(DeprecationWarning, match="get_countries_by_tier"):
+            assert world.get_tier4_countries_list() is world.get_countries_by_tier(4)
+        with pytest.warns(DeprecationWarning, match="get_country"):
+            assert world.get_tier5_country("BWA") is world.countries["BWA"]
+        with pytest.warns(DeprecationWarning):
+            assert world.get_tier6_country("BWA") is None
+
+    def test_tier_country_lookup_does_not_warn(self):
+        """Test the tier routes' lookup avoids the deprecated getters"""
+        world = _make_world()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert get_tier_country(world, 4, "KEN") is world.countries["KEN"]
+            assert get_tier_country(world, 5, "KEN") is None
+            assert get_tier_country(world, 6, "ZZZ") is None
+
+    def test_register_country_replaces_existing(self):
+        """Test re-registering an id leaves no stale index entries"""
+        world = _make_world()
+        world._register_country(BaseCountry(id="KEN", name="Kenya", name_fr="Kenya", tier=5, region="east_africa"))
+        assert world.get_countries_by_tier(4) == ()
+        assert [c.id for c in world.get_countries_by_tier(5)] == ["KEN", "BWA"]
+        assert world.get_countries_by_region("africa") == [world.countries["BWA"]]
+
+    def test_indexes_rebuilt_from_saved_state(self):
+        """Test a world rebuilt from model_dump() has usable indexes"""
+        world = _make_world()
+        dumped = world.model_dump()
+        assert "attribute_index" not in dumped
+
+        restored = UnifiedWorld(**dumped)
+        assert restored.get_countries_by_region("africa") == [
+            restored.countries["KEN"], restored.countries["BWA"],
+        ]
+
+    def test_tier_changes_move_countries(self):
+        """Test process_tier_changes keeps the tier index current"""
+        world = UnifiedWorld()
+        world._register_country(BaseCountry(id="KEN", name="Kenya", name_fr="Kenya", tier=4))
+        world._register_country(BaseCountry(id="BWA", name="Botswana", name_fr="Botswana", tier=5))
+        assert [c.id for c in world.get_countries_by_tier(4)] == ["KEN"]
+        moved = {}
+        for _ in range(5):  # demotion needs several ticks below threshold
+            for event in world.process_tier_changes():
+                moved[event["country_id"]] = event["new_tier"]
+
+        assert moved.get("KEN") == 5
+        assert world.get_countries_by_tier(4) == ()
+        # Moved countries keep countries order within their new tier
+        assert [c.id for c in world.get_countries_by_tier(5)] == ["KEN", "BWA"]
+        for country_id, tier in moved.items():
+            assert world.countries[country_id] in world.get_countries_by_tier(tier)
+
+    def test_refresh_indexes_after_direct_tier_write(self):
+        """Test a tier set outside process_tier_changes is re-filed on refresh"""
+        world = _make_world()
+        world.countries["FRA"].tier = 1
+        world.refresh_indexes()
+        assert [c.id for c in world.get_superpowers()] == ["USA", "FRA"]
+        assert world.get_countries_by_tier(2) == ()
+
+    def test_tier_lists_dropped_after_scenario(self):
+        """Test cached tier tuples reflect scenario tier overrides"""
+        world = load_unified_world_from_json(DATA_DIR)
+        world.get_major_powers()  # prime the cache before the scenario
+        manager = ScenarioManager()
+        manager.load_scenarios(DATA_DIR)
+        assert manager.start_scenario("multipolar_2040", world, "USA")
+
+        majors = [c.id for t in (1, 2) for c in world.countries.values() if c.tier == t]
+        assert "IND" in majors and "BRA" in majors
+        assert [c.id for c in world.get_major_powers()] == majors
+
+    def test_tier_stats_match_tier_manager(self):
+        """Test tier stats come from the index and match a full scan"""
+        world = _make_world()
+        assert world.get_tier_stats() == {1: 1, 2: 1, 3: 0, 4: 1, 5: 1, 6: 0}
+        world._register_country(BaseCountry(id="KEN", name="Kenya", name_fr="Kenya", tier=6))
+        assert world.get_tier_stats() == TierManager.get_tier_stats(world.countries)
+
+    def test_nuclear_powers_follow_arsenal(self):
+        """Test nuclear powers reflect arsenal changes and newly armed countries"""
+        world = _make_world()
+        world._register_country(BaseCountry(id="PAK", name="Pakistan", name_fr="Pakistan", tier=3, nuclear=0))
+        assert [c.id for c in world.get_nuclear_powers()] == ["USA"]
+
+        world.countries["PAK"].nuclear = 20
+        world.countries["USA"].nuclear = 0
+        assert [c.id for c in world.get_nuclear_powers()] == ["PAK"]
+
+        world.countries["KEN"].nuclear = 5
+        assert "KEN" not in [c.id for c in world.get_nuclear_powers()]
+        world.mark_nuclear_changed("KEN")
+        assert "KEN" in [c.id for c in world.get_nuclear_powers()]
+
+    @pytest.mark.parametrize("scenario_id", ["multipolar_2040", "cold_war_1962"])
+    def test_tier_stats_after_scenario(self, scenario_id):
+        """Test tier stats count scenario tier overrides like a full scan"""
+        world = load_unified_world_from_json(DATA_DIR)
+        manager = ScenarioManager()
+        manager.load_scenarios(DATA_DIR)
+        assert manager.start_scenario(scenario_id, world, "USA")
+        assert world.get_tier_stats() == TierManager.get_tier_stats(world.countries)
+
+    def test_countries_to_process_follow_frequency(self):
+        """Test only countries whose frequency divides the tick are due"""
+        world = _make_world()
+        world.countries["KEN"].process_frequency = 2
+        world.countries["BWA"].process_frequency = 3
+        due = {}
+        for tick in range(7):
+            world.tick_counter = tick
+            due[tick] = [c.id for c in world.get_countries_to_process()]
+
+        assert due[0] == ["USA", "FRA", "KEN", "BWA"]
+        assert due[1] == ["USA", "FRA"]
+        assert due[4] == ["USA", "FRA", "KEN"]
+        assert due[3] == ["USA", "FRA", "BWA"]
+        for tick, ids in due.items():
+            assert ids == [
+                c.id for c in world.countries.values() if c.should_process_this_tick(tick)
+            ]
+
+    def test_tier_lists_shared_until_membership_changes(self):
+        """Test tier results are reused and refreshed on registration"""
+        world = _make_world()
+        majors = world.get_major_powers()
+        assert world.get_major_powers() is majors
+        assert world.get_countries_by_tier(1) is world.get_superpowers()
+
+        world._register_country(BaseCountry(id="CHN", name="China", name_fr="Chine", tier=1))
+        assert [c.id for c in world.get_major_powers()] == ["USA", "CHN", "FRA"]
+
+
+class TestUnifiedConflicts:
+    """Test UnifiedWorld conflict bookkeeping"""
+
+    def setup_method(self):
+        self.world = _make_world()
+
+    def test_start_and_end_conflict(self):
+        """Test wars are recorded on both sides and cleared on end"""
+        conflict = self.world.start_conflict(["USA", "FRA"], ["KEN", "ZZZ"])
+        assert self.world.countries["USA"].at_war == {"KEN", "ZZZ"}
+        assert self.world.countries["KEN"].at_war == {"USA", "FRA"}
+        assert conflict.nuclear_risk == 20  # USA is nuclear
+
+        self.world.end_conflict(conflict.id)
+        assert self.world.countries["USA"].at_war == set()
+        assert self.world.countries["KEN"].at_war == set()
+        assert self.world.active_conflicts == []
+
+    def test_repeated_conflict_ids_end_oldest_first(self):
+        """Test a repeated matchup in the same year shares an id and ends in order"""
+        first = self.world.start_conflict(["USA"], ["KEN"])
+        second = self.world.start_conflict(["USA"], ["KEN"], region="africa")
+        assert first.id == second.id
+
+        self.world.end_conflict(first.id)
+        assert len(self.world.active_conflicts) == 1
+        assert self.world.active_conflicts[0] is second
+        assert self.world.conflict_index[first.id] is second
+
+        self.world.end_conflict(first.id)
+        assert self.world.active_conflicts == []
+        assert self.world.conflict_index == {}
+
+    def test_conflict_index_rebuilt_from_saved_state(self):
+        """Test a reloaded world can end its saved conflicts"""
+        conflict = self.world.start_conflict(["FRA"], ["KEN"])
+        restored = UnifiedWorld(**self.world.model_dump())
+        assert "conflict_index" not in self.world.model_dump()
+        restored.end_conflict(conflict.id)
+        assert restored.active_conflicts == []
+
+    def test_no_nuclear_risk_without_nuclear_power(self):
+        """Test conventional wars carry no nuclear risk"""
+        conflict = self.world.start_conflict(["KEN"], ["BWA"])
+        assert conflict.nuclear_risk == 0
+
+
+class TestUnifiedRelations:
+    """Test UnifiedWorld relation initialization"""
+
+    def test_alignment_relations_by_band(self):
+        """Test Tier 4-6 relations follow alignment bands for present powers"""
+        world = UnifiedWorld()
+        world._register_country(BaseCountry(id="USA", name="USA", name_fr="USA", tier=1))
+        world._register_country(BaseCountry(id="RUS", name="Russia", name_fr="Russie", tier=1))
+        world._register_country(BaseCountry(id="PRW", name="West", name_fr="Ouest", tier=5, alignment=-31))
+        world._register_country(BaseCountry(id="NEU", name="Neutral", name_fr="Neutre", tier=6))
+        world._register_country(BaseCountry(id="PRE", name="East", name_fr="Est", tier=4, alignment=80))
+        _init_alignment_relations(world)
+
+        assert world.countries["PRW"].relations == {"USA": 30, "RUS": -25}
+        assert world.countries["NEU"].relations == {"USA": 0, "RUS": 0}
+        assert world.countries["PRE"].relations == {"USA": -20, "RUS": 30}
+        assert world.countries["USA"].relations == {}
+
+    def test_major_power_relations(self):
+        """Test bloc beats rivalry, rivalry beats alliance, others are 0"""
+        world = UnifiedWorld()
+        world._register_country(BaseCountry(
+            id="FRA", name="France", name_fr="France", tier=2,
+            blocs=["EU"], rivals=["DEU", "RUS"], allies=["RUS", "GBR"],
+        ))
+        world._register_country(BaseCountry(id="DEU", name="Germany", name_fr="Allemagne", tier=2, blocs=["EU"]))
+        world._register_country(BaseCountry(id="RUS", name="Russia", name_fr="Russie", tier=1))
+        world._register_country(BaseCountry(id="GBR", name="UK", name_fr="Royaume-Uni", tier=2))
+        world._register_country(BaseCountry(id="KEN", name="Kenya", name_fr="Kenya", tier=4))
+        _init_major_power_relations(world)
+
+        assert world.countries["FRA"].relations == {"DEU": 30, "RUS": -50, "GBR": 50}
+        assert world.countries["GBR"].relations == {"FRA": 0, "DEU": 0, "RUS": 0}
+        assert world.countries["KEN"].relations == {}
+
+
+class TestUnifiedEventsHistory:
+    """Test UnifiedWorld event history"""
+
+    def test_history_is_bounded_and_tail_ordered(self):
+        """Test old events drop off and recent events keep their order"""
+        world = UnifiedWorld()
+        for n in range(MAX_EVENTS_HISTORY + 3):
+            world.add_event(Event(
+                id=f"evt_{n}", year=2025, type="test", title="Test", title_fr="Test",
+                description="Test", description_fr="Test",
+            ))
+        assert len(world.events_history) == MAX_EVENTS_HISTORY
+        assert [e.id for e in world.get_recent_events(2)] == [
+            f"evt_{MAX_EVENTS_HISTORY + 1}", f"evt_{MAX_EVENTS_HISTORY + 2}",
+        ]
+
+        restored = UnifiedWorld.model_validate_json(world.model_dump_json())
+        assert restored.events_history.maxlen == MAX_EVENTS_HISTORY